@@ -5,57 +5,125 @@ Interface linda para o pipeline de CVs
 """
 
 import sys
+import os
+import re
 import json
+import copy
+import hashlib
+import math
 import threading
 import time
+import traceback
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from string import Template
+from dataclasses import asdict, is_dataclass
+from datetime import datetime
 from pathlib import Path
+
+import orjson
 from flask import Flask, render_template, request, jsonify, send_file
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
 
 # Add parent to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from core import Language, OutputFormat, OUTPUT_DIR, JOBS_DIR, JobStatus, StrategicPlan, MatchTier
+from core import Language, OutputFormat, OUTPUT_DIR, JOBS_DIR, JobStatus, StrategicPlan, MatchTier, ensure_dirs
+from core.models import ExperienceMatch, Job, ResumeOutput
 from engine import JobInterpreter, CVMatcher, MasterCV, create_job_from_scrape, build_resume
 from engine.strategy import StrategicAnalyzer
 from engine.tailor_engine import TailoringEngine
 from scraper import scrape_jobs
 from engine.matcher_utils import MASTER_PROFILE_PATH
+from tailor import scrape_url, render_html
+
+# WeasyPrint é pesado e opcional: resolvido uma vez no load do módulo,
+# em vez de passar pelo import machinery a cada request
+try:
+    from weasyprint import HTML as WeasyHTML
+    _HAS_WEASYPRINT = True
+except ImportError:
+    WeasyHTML = None
+    _HAS_WEASYPRINT = False
 
 SCRAPED_JOBS_FILE = JOBS_DIR / "scraped_jobs.json"
 
+
+def _json_default(obj):
+    """Fallback encoder for types orjson doesn't handle natively"""
+    if is_dataclass(obj):
+        return asdict(obj)
+    if isinstance(obj, Path):
+        return str(obj)
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Type is not JSON serializable: {type(obj)}")
+
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson (C encoder, 2-10x faster than stdlib)"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=_json_default).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+# In-memory cache: avoids re-parsing scraped_jobs.json on every request.
+# Invalidated by mtime, updated in-place on save.
+_JOBS_CACHE = {"mtime": None, "data": None}
+_JOBS_LOCK = threading.Lock()
+
+
 def load_scraped_jobs():
     if not SCRAPED_JOBS_FILE.exists():
         return []
     try:
-        with open(SCRAPED_JOBS_FILE, "r") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, FileNotFoundError, Exception) as e:
+        mtime = SCRAPED_JOBS_FILE.stat().st_mtime_ns
+        with _JOBS_LOCK:
+            if _JOBS_CACHE["mtime"] == mtime and _JOBS_CACHE["data"] is not None:
+                # Shallow copy: callers may append/remove without corrupting the cache
+                return copy.copy(_JOBS_CACHE["data"])
+            data = orjson.loads(SCRAPED_JOBS_FILE.read_bytes())
+            _JOBS_CACHE["mtime"] = mtime
+            _JOBS_CACHE["data"] = data
+            return copy.copy(data)
+    except (orjson.JSONDecodeError, FileNotFoundError, Exception) as e:
         print(f"[WARN] Failed to load scraped jobs: {e}")
         return []
 
+def _sanitize(obj):
+    """
+    orjson default hook: plain floats (including NaN/Inf -> null) are handled
+    natively in C, so only float subclasses and unknown types land here.
+    """
+    if isinstance(obj, float):
+        return float(obj) if math.isfinite(obj) else None
+    raise TypeError(f"Type is not JSON serializable: {type(obj)}")
+
+
 def save_scraped_jobs(jobs):
-    import math
-    def clean_nan(obj):
-        if isinstance(obj, float) and (math.isnan(obj) or math.isinf(obj)):
-            return None
-        if isinstance(obj, dict):
-            return {k: clean_nan(v) for k, v in obj.items()}
-        if isinstance(obj, list):
-            return [clean_nan(x) for x in obj]
-        return obj
-
-    cleaned_jobs = clean_nan(jobs)
-    with open(SCRAPED_JOBS_FILE, "w") as f:
-        json.dump(cleaned_jobs, f, indent=2, ensure_ascii=False)
-
-app = Flask(__name__, 
+    # orjson encodes in C and already emits null for NaN/Inf floats,
+    # replacing the old recursive clean_nan walk over the whole list.
+    payload = orjson.dumps(jobs, default=_sanitize, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    tmp_path = SCRAPED_JOBS_FILE.with_suffix(".json.tmp")
+    with _JOBS_LOCK:
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, SCRAPED_JOBS_FILE)
+        _JOBS_CACHE["mtime"] = SCRAPED_JOBS_FILE.stat().st_mtime_ns
+        _JOBS_CACHE["data"] = jobs
+
+app = Flask(__name__,
     template_folder='web/templates',
     static_folder='web/static'
 )
+app.json = OrjsonProvider(app)
 CORS(app)
 
 # Ensure directories exist
+ensure_dirs()
 (Path(__file__).parent / "web/templates").mkdir(parents=True, exist_ok=True)
 (Path(__file__).parent / "web/static").mkdir(parents=True, exist_ok=True)
 
@@ -76,6 +144,31 @@ def index():
     return render_template('index.html')
 
 
+# URL scrape cache (TTL): users iterating in the UI re-analyze the same
+# posting repeatedly; skip the HTTP fetch + parse when we saw it recently.
+_SCRAPE_CACHE = {}  # url -> (timestamp, (title, company, description, location))
+_SCRAPE_CACHE_LOCK = threading.Lock()
+_SCRAPE_CACHE_TTL = 3600
+_SCRAPE_CACHE_MAX = 256
+
+
+def _scrape_url_cached(url):
+    now = time.time()
+    with _SCRAPE_CACHE_LOCK:
+        hit = _SCRAPE_CACHE.get(url)
+        if hit and now - hit[0] < _SCRAPE_CACHE_TTL:
+            return hit[1]
+
+    result = scrape_url(url)
+
+    with _SCRAPE_CACHE_LOCK:
+        _SCRAPE_CACHE[url] = (now, result)
+        if len(_SCRAPE_CACHE) > _SCRAPE_CACHE_MAX:
+            oldest = min(_SCRAPE_CACHE, key=lambda k: _SCRAPE_CACHE[k][0])
+            del _SCRAPE_CACHE[oldest]
+    return result
+
+
 @app.route('/api/analyze', methods=['POST'])
 def analyze():
     """
@@ -88,10 +181,9 @@ def analyze():
     if not job_input:
         return jsonify({'error': 'Nenhuma vaga informada'}), 400
     
-    # Para URLs, fazer scraping
+    # Para URLs, fazer scraping (com cache TTL)
     if source == 'url':
-        from tailor import scrape_url
-        title, company, description, location = scrape_url(job_input)
+        title, company, description, location = _scrape_url_cached(job_input)
     else:
         title = data.get('title', 'Vaga')
         company = data.get('company', 'Empresa')
@@ -186,6 +278,10 @@ def match():
     })
 
 
+# Pool para chamadas LLM paralelas dentro de um mesmo request (I/O-bound)
+_TAILOR_EXECUTOR = ThreadPoolExecutor(max_workers=4)
+
+
 @app.route('/api/match/force', methods=['POST'])
 def force_match():
     """
@@ -210,10 +306,15 @@ def force_match():
     # 1. Load Master
     lang = Language.PT if language == 'pt' else Language.EN
     master = MasterCV.load(language=lang)
-    
-    # 2. Tailor ALL Experiences
+
+    # 2. Tailor ALL Experiences + Summary em paralelo: ambas são chamadas
+    # LLM I/O-bound, rodar em sequência somaria as duas latências
     engine = TailoringEngine()
-    tailored_exps = engine.tailor_all_experiences(job, master.data)
+    exps_future = _TAILOR_EXECUTOR.submit(engine.tailor_all_experiences, job, master.data)
+    profile_summary = f"{master.candidato.get('nome_completo')} - 15+ years experience in {', '.join(master.skills.get('core', []))}"
+    summary_future = _TAILOR_EXECUTOR.submit(engine.tailor_summary, job, profile_summary)
+
+    tailored_exps = exps_future.result()
     
     # Update master with tailored experiences in-memory
     master.experiencias = tailored_exps
@@ -236,8 +337,6 @@ def force_match():
     # Since we updated 'master.experiencias' above with tailored bullets, 
     # build_resume will pick them up even if not in 'selected'.
     # BUT, to be safe and consistent with UI showing "matched" items:
-    from core.models import ExperienceMatch
-    
     all_selected = []
     for exp in tailored_exps:
         all_selected.append(ExperienceMatch(
@@ -252,10 +351,9 @@ def force_match():
     
     base_match.selected_experiences = all_selected
 
-    # 4. Tailor Summary (Agentic Rewrite)
-    profile_summary = f"{master.candidato.get('nome_completo')} - 15+ years experience in {', '.join(master.skills.get('core', []))}"
-    tailored_summary = engine.tailor_summary(job, profile_summary)
-    
+    # 4. Tailor Summary (Agentic Rewrite) — disparado acima, coletado aqui
+    tailored_summary = summary_future.result()
+
     # Update result
     base_match.selected_summary = tailored_summary
     
@@ -285,13 +383,133 @@ def force_match():
     })
 
 
+# Slug de empresa para nomes de arquivo (compilado uma vez)
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+# Styles + page wrapper for the Edit Mode (html_override) branch.
+# Built once at import time; per-request work is a single substitute().
+_EDIT_MODE_STYLE = """
+        <style>
+            * { margin: 0; padding: 0; box-sizing: border-box; }
+            body {
+                font-family: 'Segoe UI', Tahoma, sans-serif;
+                font-size: 11pt;
+                line-height: 1.5;
+                color: #333;
+                padding: 40px;
+                max-width: 800px;
+                margin: 0 auto;
+            }
+            h1 { font-size: 24pt; font-weight: 700; margin-bottom: 5px; }
+            h2 { font-size: 12pt; font-weight: 600; color: #444; margin: 20px 0 10px; border-bottom: 1px solid #ddd; padding-bottom: 5px; }
+            h3 { font-size: 11pt; font-weight: 600; margin-bottom: 3px; }
+            .header { margin-bottom: 20px; }
+            .contact { font-size: 10pt; color: #666; margin-bottom: 10px; }
+            .headline { font-size: 12pt; font-weight: 500; color: #555; margin-bottom: 10px; }
+            .summary { font-size: 10pt; color: #555; margin-bottom: 15px; }
+            .experience { margin-bottom: 15px; }
+            .exp-header { display: flex; justify-content: space-between; }
+            .exp-company { font-weight: 600; }
+            .exp-period { font-size: 10pt; color: #666; }
+            .exp-role { font-style: italic; margin-bottom: 5px; }
+            .exp-scope { font-size: 9pt; color: #777; margin-bottom: 5px; }
+            ul { margin-left: 20px; }
+            li { margin-bottom: 3px; font-size: 10pt; }
+            .skills { display: flex; flex-wrap: wrap; gap: 8px; }
+            .skill { background: #f0f0f0; padding: 3px 8px; border-radius: 3px; font-size: 9pt; }
+            .preview-exp-header { display: flex; justify-content: space-between; margin-bottom: 5px; } /* Adapt frontend classes */
+            .preview-bullets { margin-left: 20px; }
+        </style>
+        """
+
+_EDIT_MODE_PAGE = Template("""<!DOCTYPE html>
+        <html>
+        <head>
+            <meta charset="UTF-8">
+            """ + _EDIT_MODE_STYLE + """
+        </head>
+        <body>
+            $body
+        </body>
+        </html>""")
+
+
+# Background generation: WeasyPrint rendering is CPU-heavy and would starve
+# the other endpoints if run inline in the request handler.
+_GENERATE_EXECUTOR = ThreadPoolExecutor(max_workers=2)
+_GENERATE_TASKS = {}
+_GENERATE_LOCK = threading.Lock()
+
+# sha256(html) -> (timestamp, result), short-circuits Edit Mode re-renders.
+# Limitado como o _SCRAPE_CACHE: sem teto, um servidor de longa duração
+# acumularia um result por HTML distinto já renderizado.
+_RENDER_CACHE = {}
+_RENDER_CACHE_LOCK = threading.Lock()
+_RENDER_CACHE_MAX = 64
+
+
+def _render_cache_get(content_key):
+    with _RENDER_CACHE_LOCK:
+        hit = _RENDER_CACHE.get(content_key)
+        return hit[1] if hit else None
+
+
+def _render_cache_put(content_key, result):
+    with _RENDER_CACHE_LOCK:
+        _RENDER_CACHE[content_key] = (time.time(), result)
+        if len(_RENDER_CACHE) > _RENDER_CACHE_MAX:
+            oldest = min(_RENDER_CACHE, key=lambda k: _RENDER_CACHE[k][0])
+            del _RENDER_CACHE[oldest]
+
+
+def _generate_worker(task_id, data):
+    try:
+        result = _run_generate(data)
+        record = {'status': 'done', 'result': result}
+    except Exception as e:
+        traceback.print_exc()
+        record = {'status': 'error', 'error': str(e)}
+    with _GENERATE_LOCK:
+        _GENERATE_TASKS[task_id] = record
+
+
 @app.route('/api/generate', methods=['POST'])
 def generate():
     """
-    Step 3: Gera o CV final.
-    Suporta 'resume_data' opcional para override (Edit Mode).
+    Step 3: Dispara a geração do CV em background.
+    O frontend faz polling em /api/generate/status/<task_id>.
     """
     data = request.json
+    task_id = uuid.uuid4().hex[:12]
+    with _GENERATE_LOCK:
+        _GENERATE_TASKS[task_id] = {'status': 'pending'}
+    _GENERATE_EXECUTOR.submit(_generate_worker, task_id, data)
+    return jsonify({'success': True, 'task_id': task_id, 'status': 'pending'})
+
+
+@app.route('/api/generate/status/<task_id>')
+def generate_status(task_id):
+    """Polling da geração em background"""
+    with _GENERATE_LOCK:
+        record = _GENERATE_TASKS.get(task_id)
+        # Estado terminal entregue -> descarta o registro; sem isso cada
+        # /api/generate vazava uma entrada pela vida do processo
+        if record and record['status'] in ('done', 'error'):
+            del _GENERATE_TASKS[task_id]
+    if not record:
+        return jsonify({'success': False, 'error': 'Task não encontrada'}), 404
+    if record['status'] == 'done':
+        return jsonify({'status': 'done', **record['result']})
+    if record['status'] == 'error':
+        return jsonify({'success': False, 'status': 'error', 'error': record['error']})
+    return jsonify({'success': True, 'status': 'pending'})
+
+
+def _run_generate(data):
+    """
+    Gera o CV final (roda no executor, fora da request thread).
+    Suporta 'resume_data' opcional para override (Edit Mode).
+    """
     job_data = data.get('job', {})
     resume_data = data.get('resume_data') # Override from frontend
     language = data.get('language', 'pt')
@@ -324,7 +542,6 @@ def generate():
         else:
             # 2. Structured Data Override
             try:
-                from core.models import ResumeOutput
                 # Reconstruct ResumeOutput from dict
                 # Handle Enums
                 lang_enum = Language(resume_data.get('language', 'pt'))
@@ -364,9 +581,6 @@ def generate():
         resume = tailor.tailor_resume(resume, job, master.data)
     
     # Render
-    from tailor import render_html
-    from datetime import datetime
-    
     if html_override:
         html_content = html_override
         # Ensure it has basic structure if it's just a fragment?
@@ -380,98 +594,60 @@ def generate():
         
         # Quick hack: Load base template styles and wrap.
         # Or better: Parsing the HTML on frontend is safer, but harder.
-        # Let's wrap it in a standard template here.
-        
-        style_block = """
-        <style>
-            * { margin: 0; padding: 0; box-sizing: border-box; }
-            body { 
-                font-family: 'Segoe UI', Tahoma, sans-serif;
-                font-size: 11pt;
-                line-height: 1.5;
-                color: #333;
-                padding: 40px;
-                max-width: 800px;
-                margin: 0 auto;
-            }
-            h1 { font-size: 24pt; font-weight: 700; margin-bottom: 5px; }
-            h2 { font-size: 12pt; font-weight: 600; color: #444; margin: 20px 0 10px; border-bottom: 1px solid #ddd; padding-bottom: 5px; }
-            h3 { font-size: 11pt; font-weight: 600; margin-bottom: 3px; }
-            .header { margin-bottom: 20px; }
-            .contact { font-size: 10pt; color: #666; margin-bottom: 10px; }
-            .headline { font-size: 12pt; font-weight: 500; color: #555; margin-bottom: 10px; }
-            .summary { font-size: 10pt; color: #555; margin-bottom: 15px; }
-            .experience { margin-bottom: 15px; }
-            .exp-header { display: flex; justify-content: space-between; }
-            .exp-company { font-weight: 600; }
-            .exp-period { font-size: 10pt; color: #666; }
-            .exp-role { font-style: italic; margin-bottom: 5px; }
-            .exp-scope { font-size: 9pt; color: #777; margin-bottom: 5px; }
-            ul { margin-left: 20px; }
-            li { margin-bottom: 3px; font-size: 10pt; }
-            .skills { display: flex; flex-wrap: wrap; gap: 8px; }
-            .skill { background: #f0f0f0; padding: 3px 8px; border-radius: 3px; font-size: 9pt; }
-            .preview-exp-header { display: flex; justify-content: space-between; margin-bottom: 5px; } /* Adapt frontend classes */
-            .preview-bullets { margin-left: 20px; }
-        </style>
-        """
-        
-        html_content = f"""<!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="UTF-8">
-            {style_block}
-        </head>
-        <body>
-            {html_override}
-        </body>
-        </html>"""
-        
+        # Let's wrap it in the standard template built at module load.
+        html_content = _EDIT_MODE_PAGE.substitute(body=html_override)
+
     else:
         html_content = render_html(resume)
-    
+
+    # Identical HTML (Edit Mode round-trips) -> reuse the previous render
+    content_key = (hashlib.sha256(html_content.encode('utf-8')).hexdigest(), output_format)
+    cached = _render_cache_get(content_key)
+    if cached:
+        return cached
+
     # Save files
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    company_slug = job.company.lower().replace(" ", "_")[:20]
+    # Slug seguro: só [a-z0-9_], então company não consegue escapar do OUTPUT_DIR
+    company_slug = _SLUG_RE.sub("_", job.company.lower())[:20].strip("_") or "job"
     filename = f"{company_slug}_{timestamp}"
-    
+
     html_path = OUTPUT_DIR / f"{filename}.html"
-    html_path.write_text(html_content, encoding='utf-8')
+    html_path.write_bytes(html_content.encode('utf-8'))
     
-    if output_format == 'pdf':
+    if output_format == 'pdf' and _HAS_WEASYPRINT:
         try:
-            from weasyprint import HTML
             pdf_path = OUTPUT_DIR / f"{filename}.pdf"
-            HTML(string=html_content).write_pdf(pdf_path)
-            return jsonify({
+            WeasyHTML(string=html_content).write_pdf(pdf_path)
+            result = {
                 'success': True,
                 'file': str(pdf_path),
                 'filename': f"{filename}.pdf",
                 'format': 'pdf'
-            })
-        except ImportError:
-            print("⚠️ WeasyPrint not installed.")
-            pass
+            }
+            _render_cache_put(content_key, result)
+            return result
         except Exception as e:
             print(f"❌ PDF Generation Failed: {e}")
-            import traceback
             traceback.print_exc()
-            return jsonify({
+            return {
                 'success': True, # Return success but with HTML only fallback
                 'file': str(html_path),
                 'filename': f"{filename}.html",
                 'format': 'html',
                 'html_preview': html_content,
                 'error': f"PDF failed: {str(e)}"
-            })
-    
-    return jsonify({
+            }
+
+    result = {
         'success': True,
         'file': str(html_path),
         'filename': f"{filename}.html",
         'format': 'html',
         'html_preview': html_content
-    })
+    }
+    _render_cache_put(content_key, result)
+    return result
 
 
 @app.route('/api/download/<filename>')
@@ -479,7 +655,16 @@ def download(filename):
     """Download do arquivo gerado"""
     filepath = OUTPUT_DIR / filename
     if filepath.exists():
-        return send_file(filepath, as_attachment=True)
+        # conditional=True enables ETag/If-Modified-Since (304) and Range
+        # requests, so browser retries don't re-transmit whole PDFs
+        return send_file(
+            filepath,
+            as_attachment=True,
+            conditional=True,
+            etag=True,
+            last_modified=filepath.stat().st_mtime,
+            max_age=0
+        )
     return jsonify({'error': 'Arquivo não encontrado'}), 404
 
 
@@ -515,14 +700,16 @@ def run_scraper_api():
     
     # Convert to dict and add to persistence
     current_jobs = load_scraped_jobs()
+    existing_ids = {j['id'] for j in current_jobs}
     new_jobs_dicts = []
-    
+
     for job_obj in found_jobs:
         # job_obj is a Job dataclass instance, convert to dict
         job_dict = job_obj.to_dict()
-        
-        # Avoid duplicates
-        if not any(j['id'] == job_dict['id'] for j in current_jobs):
+
+        # Avoid duplicates (set lookup instead of scanning the whole list per job)
+        if job_dict['id'] not in existing_ids:
+            existing_ids.add(job_dict['id'])
             new_jobs_dicts.append(job_dict)
     
     save_scraped_jobs(new_jobs_dicts + current_jobs)
@@ -574,8 +761,7 @@ def analyze_strategy():
     job_dict = data.get('job_data')
     if not job_dict:
         return jsonify({'error': 'Dados da vaga ausentes'}), 400
-        
-    from core.models import Job
+
     job_obj = Job.from_dict(job_dict)
     
     analyzer = StrategicAnalyzer()
@@ -585,13 +771,11 @@ def analyze_strategy():
     jobs_dicts = load_scraped_jobs()
     for j in jobs_dicts:
         if j['id'] == job_obj.id:
-            from dataclasses import asdict
             j['strategic_plan'] = asdict(plan)
             j['status'] = 'strategy'
             break
     save_scraped_jobs(jobs_dicts)
-    
-    from dataclasses import asdict
+
     return jsonify({
         'success': True,
         'plan': asdict(plan)
@@ -622,6 +806,11 @@ def delete_job():
     save_scraped_jobs(new_jobs)
     return jsonify({'success': True})
 
+# Interruptible timer for the cron thread: wait() returns early when set,
+# so shutdown isn't blocked by an uninterruptible 24h time.sleep.
+_CRON_WAKEUP = threading.Event()
+
+
 def background_scraper():
     """Simple background thread to simulate cron"""
     while True:
@@ -631,23 +820,25 @@ def background_scraper():
             result = scrape_jobs(query="Product Manager AI")
             found_jobs = result.get('jobs', [])
             current_jobs = load_scraped_jobs()
-            
+            existing_ids = {existing['id'] for existing in current_jobs}
+
             new_jobs = []
             for job_obj in found_jobs:
                 job_dict = job_obj.to_dict()
-                if not any(existing['id'] == job_dict['id'] for existing in current_jobs):
+                if job_dict['id'] not in existing_ids:
+                    existing_ids.add(job_dict['id'])
                     new_jobs.append(job_dict)
                     
             if new_jobs:
                 save_scraped_jobs(new_jobs + current_jobs)
                 print(f"🕒 [Cron] {len(new_jobs)} novas vagas encontradas!")
         except Exception as e:
-            import traceback
             print(f"🕒 [Cron] Erro: {e}")
             traceback.print_exc()
         
-        # Sleep for 24 hours
-        time.sleep(24 * 3600)
+        # Wait up to 24 hours, waking early if something pokes the event
+        if _CRON_WAKEUP.wait(timeout=24 * 3600):
+            _CRON_WAKEUP.clear()
 
 @app.route('/api/job/tailor_generative', methods=['POST'])
 def tailor_generative():
@@ -659,31 +850,37 @@ def tailor_generative():
     job_dict = next((j for j in jobs if j['id'] == job_id), None)
     if not job_dict:
         return jsonify({"success": False, "error": "Job not found"})
-        
-    from core.models import Job
+
     job = Job.from_dict(job_dict)
-    
+
     # Load Master CV
-    from engine.matcher import MasterCV
     master = MasterCV.load(language=job.language)
     
     engine = TailoringEngine()
     
     # Rewriting selected experiences
-    tailored_experiences = []
     # Simplified: for now we tailor all experiences in the job_dict or master
     # In a real scenario, we would use the MatchResult to select which ones to tailor
+    selected_exps = []
     for exp in master.experiencias:
         # Check if this exp is relevant (simple heuristic for now)
-        if exp.get("tier") == "core" or len(tailored_experiences) < 3:
-            bullets = engine.tailor_experience(job, exp)
-            tailored_experiences.append({
-                "company": exp.get("empresa", exp.get("company", "")),
-                "role": exp.get("cargo", exp.get("role", "")),
-                "period": exp.get("periodo", exp.get("period", "")),
-                "bullets": bullets
-            })
-            
+        if exp.get("tier") == "core" or len(selected_exps) < 3:
+            selected_exps.append(exp)
+
+    # One batched LLM call for all selected experiences instead of one per exp
+    batch_bullets = engine.tailor_batch(job, selected_exps)
+
+    tailored_experiences = [
+        {
+            "company": exp.get("empresa", exp.get("company", "")),
+            "role": exp.get("cargo", exp.get("role", "")),
+            "period": exp.get("periodo", exp.get("period", "")),
+            "bullets": bullets
+        }
+        for exp, bullets in zip(selected_exps, batch_bullets)
+    ]
+
+
     # Generate tailored summary
     profile_summary = f"{master.candidato.get('nome_completo')} - 15+ years experience in {', '.join(master.skills.get('core', []))}"
     summary = engine.tailor_summary(job, profile_summary)
@@ -703,8 +900,7 @@ def get_profile():
     if not MASTER_PROFILE_PATH.exists():
         return jsonify({'success': False, 'error': 'Perfil não encontrado'}), 404
     try:
-        with open(MASTER_PROFILE_PATH, 'r', encoding='utf-8') as f:
-            return jsonify({'success': True, 'profile': json.load(f)})
+        return jsonify({'success': True, 'profile': orjson.loads(MASTER_PROFILE_PATH.read_bytes())})
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
@@ -717,22 +913,37 @@ def save_profile():
         return jsonify({'success': False, 'error': 'Dados ausentes'}), 400
         
     try:
-        # Create backup
+        # Serialize first: nothing on disk is touched if encoding fails
+        payload = orjson.dumps(profile_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+        tmp_path = MASTER_PROFILE_PATH.with_suffix('.json.tmp')
+        tmp_path.write_bytes(payload)
+
+        # Backup previous contents via hardlink (no copy), then atomic swap
         backup_path = MASTER_PROFILE_PATH.with_suffix('.json.bak')
-        import shutil
         if MASTER_PROFILE_PATH.exists():
-            shutil.copy2(MASTER_PROFILE_PATH, backup_path)
-            
-        with open(MASTER_PROFILE_PATH, 'w', encoding='utf-8') as f:
-            json.dump(profile_data, f, indent=4, ensure_ascii=False)
-            
-        return jsonify({'success': True})
-    except Exception as e:
+            backup_path.unlink(missing_ok=True)
+            os.link(MASTER_PROFILE_PATH, backup_path)
+        os.replace(tmp_path, MASTER_PROFILE_PATH)
+
         return jsonify({'success': True})
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+# "Must Have" ATS keywords checked against the generated output.
+# Compiled once into a single alternation so the content is scanned in one
+# pass instead of once per keyword.
+ATS_KEYWORDS_TO_CHECK = [
+    "product manager", "ai", "roadmap", "stakeholder", "agile", "scrum",
+    "python", "sql", "metrics", "kpis", "okrs", "growth", "strategy",
+    "leadership", "communication"
+]
+_ATS_KEYWORDS_RE = re.compile(
+    "|".join(re.escape(k) for k in sorted(ATS_KEYWORDS_TO_CHECK, key=len, reverse=True))
+)
+
+
 @app.route('/api/ats_check', methods=['POST'])
 def ats_check():
     """
@@ -766,26 +977,21 @@ def ats_check():
     # OR we can assume the user wants to check against the LAST viewed job?
     # The frontend doesn't send job_id.
     
-    # Let's check against a list of "Must Have" ATS keywords based on the content itself
-    # If the content contains "Product Manager", we check PM keywords.
-    
-    keywords_to_check = [
-        "product manager", "ai", "roadmap", "stakeholder", "agile", "scrum",
-        "python", "sql", "metrics", "kpis", "okrs", "growth", "strategy",
-        "leadership", "communication"
-    ]
-    
+    # Single multi-pattern pass over the content (instead of one full
+    # scan per keyword)
+    hits = {m.group(0).lower() for m in _ATS_KEYWORDS_RE.finditer(content)}
+
     found = []
     missing = []
-    
-    for k in keywords_to_check:
-        if k in content:
+
+    for k in ATS_KEYWORDS_TO_CHECK:
+        if k in hits:
             found.append(k)
         else:
             missing.append(k)
-            
+
     # Calculate fake score
-    score = int((len(found) / len(keywords_to_check)) * 100)
+    score = int((len(found) / len(ATS_KEYWORDS_TO_CHECK)) * 100)
     
     warnings = []
     if score < 70:
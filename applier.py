@@ -3,49 +3,206 @@ import os
 import json
 import time
 import asyncio
+import hashlib
+import inspect
 import random
+import re
+import sqlite3
+from functools import lru_cache
 from pathlib import Path
-from playwright.async_api import async_playwright
-import google.generativeai as genai
-from dotenv import load_dotenv
+import orjson
 
-# Load Env
-load_dotenv()
+# Heavy SDKs (playwright, google.generativeai) are imported lazily: together
+# they cost the better part of a second at import time, which --help and the
+# test scripts shouldn't pay.
+
+# Playwright calls inspect.stack() on every API call to attribute it in the
+# trace viewer, and the default context=1 reads source lines from disk for
+# every frame. With dozens of calls per form page that adds up. Opt-in patch:
+# keep the stack walk but skip source-line extraction. Trade-off: traces lose
+# the source snippet next to each call (file/line info is preserved).
+if os.getenv("APPLIER_FAST_STACKS") == "1":
+    _original_stack = inspect.stack
+    inspect.stack = lambda context=1: _original_stack(0)
+    print("⚡ [SYSTEM] inspect.stack patched (context=0) — lighter Playwright call tracing.")
 
 # Config
 BASE_DIR = Path(__file__).parent
 MASTER_PROFILE_PATH = BASE_DIR / "master_profile_v8.json"
 PREFERENCES_PATH = BASE_DIR / "preferences.json"
+ANSWER_CACHE_PATH = BASE_DIR / "answer_cache.sqlite"
+# Fuzzy cache matching: questions with >= this token overlap (Jaccard) are
+# treated as the same question ("How many years of Python?" vs
+# "How many years of experience with Python?").
+SIMILARITY_THRESHOLD = 0.75
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Labels LinkedIn pre-fills from the profile — never ask the AI about these
+_SKIP_LABELS = frozenset([
+    "First name", "Last name", "Email address", "Phone country code", "Mobile phone number",
+])
+# Matches the navigation buttons of the Easy Apply modal
+_SUBMIT_RE = re.compile(r"next|review|submit", re.IGNORECASE)
+
+# Question classification: Yes/No and numeric answers are 1-3 tokens, so we
+# cap output tokens and stop streaming as soon as the answer is parseable
+# Anything that signals the next application step is actionable: the modal
+# itself, a form label, or the confirmation header
+_STEP_READY_SELECTOR = ".artdeco-modal, .fb-dash-form-element__label, h2:has-text('submitted')"
+_YESNO_Q_RE = re.compile(r"^(do|does|did|are|is|have|has|can|will|would|você)\b", re.IGNORECASE)
+_NUMBER_Q_RE = re.compile(r"how many|years of|quantos|anos de", re.IGNORECASE)
+_YESNO_ANS_RE = re.compile(r"^(yes|no|sim|n[aã]o)\b", re.IGNORECASE)
+_NUMBER_ANS_RE = re.compile(r"^\d+([.,]\d+)?$")
+
+
+def _classify_question(question_text):
+    """'yesno', 'number' or None (free text)."""
+    if _NUMBER_Q_RE.search(question_text):
+        return "number"
+    if _YESNO_Q_RE.match(question_text.strip()):
+        return "yesno"
+    return None
+
+
+def _is_terminal_answer(buf, qclass):
+    text = buf.strip()
+    if qclass == "number":
+        return bool(_NUMBER_ANS_RE.match(text))
+    if qclass == "yesno":
+        return bool(_YESNO_ANS_RE.match(text))
+    return False
+
+
+def _tokenize(text):
+    """Lowercase token set used for fuzzy question matching."""
+    return frozenset(_TOKEN_RE.findall(text.lower()))
 # Default path for Chrome on macOS
 CHROME_PATH = "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
 USER_DATA_DIR = os.path.expanduser("~/Library/Application Support/Google/Chrome")
 
-# LLM Config
-try:
+@lru_cache(maxsize=8)
+def _cached_json(path_str, mtime_ns):
+    """Parse a JSON file once per (path, mtime). Callers must not mutate
+    the returned dict — it's shared across applier instances."""
+    return orjson.loads(Path(path_str).read_bytes())
+
+
+@lru_cache(maxsize=1)
+def _load_env():
+    from dotenv import load_dotenv
+    load_dotenv()
+
+
+@lru_cache(maxsize=1)
+def _genai():
+    """Import and configure google.generativeai on first use."""
+    _load_env()
+    import google.generativeai as genai
     genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
-    model = genai.GenerativeModel('gemini-2.0-flash')
-except Exception as e:
-    print(f"⚠️ [SYSTEM] Gemini Config Error: {e}")
+    return genai
+
+
+@lru_cache(maxsize=1)
+def _get_model():
+    """Single shared GenerativeModel, built on first use."""
+    return _genai().GenerativeModel('gemini-2.0-flash')
+
+
+def _warmup_model():
+    """Tiny generate call to open the HTTPS connection pool early."""
+    try:
+        genai = _genai()
+        _get_model().generate_content(
+            "ok", generation_config=genai.GenerationConfig(max_output_tokens=1)
+        )
+        print("🔥 [AI] Gemini connection warmed up.")
+    except Exception as e:
+        print(f"⚠️ [AI] Warmup failed (non-fatal): {e}")
 
 class LinkedInApplier:
     def __init__(self, user_data_dir=None):
         print("🚀 [APPLIER] Starting LinkedIn Easy Apply Bot...")
+        _load_env()
         self.profile = self._load_json(MASTER_PROFILE_PATH)
         self.preferences = self._load_json(PREFERENCES_PATH)
         self.user_data_dir = user_data_dir or USER_DATA_DIR
+        # Two-tier answer cache: memory first, sqlite for reuse across runs.
+        # LinkedIn repeats the same questions across jobs, so cache hits skip
+        # the Gemini round-trip entirely.
+        self._answer_cache = {}
+        self._cache_db = sqlite3.connect(ANSWER_CACHE_PATH)
+        self._cache_db.execute(
+            "CREATE TABLE IF NOT EXISTS answers (key TEXT PRIMARY KEY, qtype TEXT, question TEXT, value TEXT)"
+        )
+        self._cache_db.commit()
+        # Invariant prompt prefix, built once: re-serializing preferences and
+        # rebuilding this block per question wasted CPU and defeats prompt
+        # caching on the Gemini side
+        self._prompt_prefix = f"""
+        INSTRUÇÃO DE RESPOSTA: Você é um assistente de preenchimento de vagas do LinkedIn.
+        Responda baseando-se nos fatos reais do perfil e preferências do candidato.
+
+        PERFIL (RESUMO):
+        - Nome: {self.profile.get('candidato', {}).get('nome_completo')}
+        - Experiência: 15+ anos (Meta, Ambev, Dow)
+        - Stack Martech: HubSpot, Salesforce, GoHighLevel, n8n, Python, SQL
+        - Idiomas: Português (Nativo), Inglês (Fluente), Espanhol (Avançado)
+        - Localização: São Paulo (Remoto disponível)
+
+        PREFERÊNCIAS:
+        {json.dumps(self.preferences, indent=2)}
+
+        REGRAS:
+        1. Fatos Reais: Use os 15 anos de experiência e a passagem pela Meta para validar números.
+        2. Contexto Técnico: Para ferramentas, cite HubSpot e CRM conforme documentado no perfil.
+        3. Tom de Voz: Profissional e direto.
+        4. Se a pergunta for Sim/Não, responda apenas 'Yes' ou 'No' baseado na compatibilidade.
+        5. Se for um número (ex: anos de experiência), responda apenas o número.
+        6. Se for texto curto, seja extremamente conciso (max 10-15 palavras).
+        """
+        # Set by _init_prompt_cache when Gemini's explicit context cache
+        # accepts the prefix; None means send full prompts
+        self._cached_model = None
+        # Deterministic questions never need the LLM: the answer is already
+        # in preferences.json (or is a fixed fact of the profile). First
+        # matching rule wins; a falsy answer falls through to Gemini.
+        prefs = self.preferences
+        self._rules = [
+            (re.compile(r"authorized to work|work authorization|autorizad[oa]", re.IGNORECASE),
+             lambda: prefs.get("autorizacao_trabalho", "Yes")),
+            (re.compile(r"sponsorship|visto de trabalho", re.IGNORECASE),
+             lambda: prefs.get("precisa_sponsorship", "No")),
+            (re.compile(r"years? of (work )?experience|anos de experiência", re.IGNORECASE),
+             lambda: str(prefs.get("anos_experiencia", "15"))),
+            (re.compile(r"salary|remuneraç|pretensão salarial", re.IGNORECASE),
+             lambda: str(prefs.get("pretensao_salarial", ""))),
+            (re.compile(r"notice period|aviso prévio|start date|data de início", re.IGNORECASE),
+             lambda: prefs.get("disponibilidade", "Immediate")),
+            (re.compile(r"relocat|mudar de cidade", re.IGNORECASE),
+             lambda: prefs.get("aceita_relocacao", "Yes")),
+        ]
+        # In-memory index for fuzzy lookups: (qtype, token_set, answer)
+        self._question_index = [
+            (qtype, _tokenize(question), value)
+            for qtype, question, value in self._cache_db.execute("SELECT qtype, question, value FROM answers")
+        ]
         self.playwright = None
         self.browser = None
         self.context = None
         self.page = None
+        # Per-character typing is ~2s per field; fill() is instant and
+        # LinkedIn's form widgets accept it fine. Flip this on only if a
+        # form starts rejecting programmatic input.
+        self.human_typing = False
 
     def _load_json(self, path):
         if path.exists():
-            with open(path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return _cached_json(str(path), path.stat().st_mtime_ns)
         print(f"⚠️ [APPLIER] File not found: {path}")
         return {}
 
     async def init_browser(self):
+        from playwright.async_api import async_playwright
         print(f"🌐 [APPLIER] Launching Chrome Context from: {self.user_data_dir}")
         self.playwright = await async_playwright().start()
         
@@ -61,145 +218,382 @@ class LinkedInApplier:
             )
             self.page = self.context.pages[0] if self.context.pages else await self.context.new_page()
             print("✅ [APPLIER] Browser initialized (Persistent Profile).")
+            # Prewarm Gemini and upload the prompt prefix to the context
+            # cache in parallel with the first page navigation
+            asyncio.create_task(asyncio.to_thread(_warmup_model))
+            asyncio.create_task(asyncio.to_thread(self._init_prompt_cache))
         except Exception as e:
             print(f"❌ [APPLIER] Browser init failed: {e}")
             print("⚠️ Tip: Make sure Google Chrome is completely closed before running this script.")
             await self.shutdown()
 
     async def human_type(self, element, text):
-        """Simulate human typing speed"""
+        """Fill an input; optionally simulate human typing speed"""
+        if not self.human_typing:
+            await element.fill(text)
+            return
         await element.click()
-        for char in text:
-            await self.page.keyboard.type(char)
-            await asyncio.sleep(random.uniform(0.05, 0.15))
+        # ElementHandle (vindo de query_selector) não tem press_sequentially
+        # (API só de Locator); type() é o equivalente com delay por tecla
+        await element.type(text, delay=random.uniform(50, 150))
 
-    async def get_ai_answer(self, question_text, question_type="text"):
-        print(f"🧠 [AI] Answering: {question_text[:50]}...")
-        prompt = f"""
-        INSTRUÇÃO DE RESPOSTA: Você é um assistente de preenchimento de vagas do LinkedIn.
-        Responda à pergunta baseando-se nos fatos reais do perfil e preferências do candidato.
+    def _init_prompt_cache(self):
+        """Upload the invariant prompt prefix to Gemini's context cache.
 
-        PERFIL (RESUMO):
-        - Nome: {self.profile.get('candidato', {}).get('nome_completo')}
-        - Experiência: 15+ anos (Meta, Ambev, Dow)
-        - Stack Martech: HubSpot, Salesforce, GoHighLevel, n8n, Python, SQL
-        - Idiomas: Português (Nativo), Inglês (Fluente), Espanhol (Avançado)
-        - Localização: São Paulo (Remoto disponível)
+        Best effort: the caching API enforces a minimum prefix size and may
+        be unavailable, in which case we keep sending full prompts.
+        """
+        try:
+            genai = _genai()
+            cache = genai.caching.CachedContent.create(
+                model="models/gemini-2.0-flash",
+                contents=[self._prompt_prefix],
+                ttl="3600s",
+            )
+            self._cached_model = genai.GenerativeModel.from_cached_content(cached_content=cache)
+            print("📦 [AI] Prompt prefix uploaded to Gemini context cache.")
+        except Exception as e:
+            print(f"⚠️ [AI] Context cache unavailable, sending full prompts: {e}")
 
-        PREFERÊNCIAS:
-        {json.dumps(self.preferences, indent=2)}
+    def _model_and_prompt(self, tail):
+        """Pick the cached-prefix model when available, else prepend the prefix."""
+        if self._cached_model is not None:
+            return self._cached_model, tail
+        return _get_model(), self._prompt_prefix + tail
 
-        REGRAS:
-        1. Fatos Reais: Use os 15 anos de experiência e a passagem pela Meta para validar números.
-        2. Contexto Técnico: Para ferramentas, cite HubSpot e CRM conforme documentado no perfil.
-        3. Tom de Voz: Profissional e direto. 
-        4. Se a pergunta for Sim/Não, responda apenas 'Yes' ou 'No' baseado na compatibilidade.
-        5. Se for um número (ex: anos de experiência), responda apenas o número.
-        6. Se for texto curto, seja extremamente conciso (max 10-15 palavras).
+    def _rule_answer(self, question_text):
+        """Answer deterministic questions from the rule table, or None."""
+        for pattern, answer_fn in self._rules:
+            if pattern.search(question_text):
+                answer = answer_fn()
+                if answer:
+                    return answer
+        return None
+
+    def _cache_key(self, question_text, question_type):
+        return hashlib.sha256(f"{question_type}|{question_text}".encode()).hexdigest()
+
+    def _cache_get(self, key, question_text, question_type):
+        if key in self._answer_cache:
+            return self._answer_cache[key]
+        row = self._cache_db.execute("SELECT value FROM answers WHERE key=?", (key,)).fetchone()
+        if row:
+            self._answer_cache[key] = row[0]
+            return row[0]
+        # Fuzzy tier: LinkedIn rewords the same question slightly between
+        # forms, which defeats the exact hash. Fall back to token overlap.
+        tokens = _tokenize(question_text)
+        if not tokens:
+            return None
+        best_answer, best_score = None, 0.0
+        for qtype, cached_tokens, value in self._question_index:
+            if qtype != question_type or not cached_tokens:
+                continue
+            score = len(tokens & cached_tokens) / len(tokens | cached_tokens)
+            if score > best_score:
+                best_answer, best_score = value, score
+        if best_score >= SIMILARITY_THRESHOLD:
+            self._answer_cache[key] = best_answer
+            return best_answer
+        return None
+
+    def _cache_put(self, key, question_text, question_type, answer):
+        self._answer_cache[key] = answer
+        self._question_index.append((question_type, _tokenize(question_text), answer))
+        self._cache_db.execute(
+            "INSERT OR REPLACE INTO answers (key, qtype, question, value) VALUES (?, ?, ?, ?)",
+            (key, question_type, question_text, answer),
+        )
+        self._cache_db.commit()
 
+    async def get_ai_answer(self, question_text, question_type="text"):
+        rule_answer = self._rule_answer(question_text)
+        if rule_answer is not None:
+            print(f"📋 [AI] Rule answer: {question_text[:50]}... -> {rule_answer}")
+            return rule_answer
+
+        key = self._cache_key(question_text, question_type)
+        cached = self._cache_get(key, question_text, question_type)
+        if cached is not None:
+            print(f"♻️ [AI] Cache hit: {question_text[:50]}... -> {cached}")
+            return cached
+
+        print(f"🧠 [AI] Answering: {question_text[:50]}...")
+        tail = f"""
         PERGUNTA DO LINKEDIN: "{question_text}"
         TIPO: {question_type}
 
         RESPOSTA FINAL (APENAS O VALOR):
         """
         try:
-            response = model.generate_content(prompt)
-            answer = response.text.strip().strip('"').strip("'")
+            genai = _genai()
+            model, prompt = self._model_and_prompt(tail)
+            # Short answers get a tight token cap; streaming lets us stop as
+            # soon as a Yes/No/number is parseable instead of waiting for the
+            # full generation
+            qclass = _classify_question(question_text)
+            gen_config = genai.GenerationConfig(
+                max_output_tokens=8 if qclass in ("yesno", "number") else 64,
+                temperature=0.0,
+            )
+            # The SDK is synchronous — consume the stream in a worker thread
+            # so parallel tabs keep making progress during the LLM RTT
+            def _consume_stream():
+                response = model.generate_content(prompt, generation_config=gen_config, stream=True)
+                buf = ""
+                for chunk in response:
+                    buf += chunk.text
+                    if _is_terminal_answer(buf, qclass):
+                        response.resolve()
+                        break
+                return buf
+
+            buf = await asyncio.to_thread(_consume_stream)
+            answer = buf.strip().strip('"').strip("'")
             print(f"✅ [AI] Answer: {answer}")
+            self._cache_put(key, question_text, question_type, answer)
             return answer
         except Exception as e:
             print(f"❌ [AI] Error generating answer: {e}")
             return "Contact candidate"
 
-    async def process_form(self):
-        """Scan page for questions and fill them"""
-        # Common LinkedIn Selectors for questions
-        labels = await self.page.query_selector_all(".fb-dash-form-element__label, label")
-        
-        for label in labels:
-            text = await label.inner_text()
-            text = text.strip()
-            if not text or len(text) < 3: continue
+    async def get_ai_answers_batch(self, questions):
+        """Answer several questions in one Gemini call.
 
-            # Avoid common non-question labels
-            if text in ["First name", "Last name", "Email address", "Phone country code", "Mobile phone number"]:
+        questions: list of {"id", "text", "type"}. Returns {id: answer}.
+        Cached questions are resolved locally; only misses go to the model,
+        in a single request instead of one per field. If the batch response
+        cannot be parsed, falls back to per-question get_ai_answer calls.
+        """
+        answers = {}
+        pending = []
+        for q in questions:
+            rule_answer = self._rule_answer(q["text"])
+            if rule_answer is not None:
+                print(f"📋 [AI] Rule answer: {q['text'][:50]}... -> {rule_answer}")
+                answers[q["id"]] = rule_answer
                 continue
+            key = self._cache_key(q["text"], q["type"])
+            cached = self._cache_get(key, q["text"], q["type"])
+            if cached is not None:
+                print(f"♻️ [AI] Cache hit: {q['text'][:50]}... -> {cached}")
+                answers[q["id"]] = cached
+            else:
+                pending.append((key, q))
+
+        if not pending:
+            return answers
+
+        print(f"🧠 [AI] Answering {len(pending)} questions in one batch...")
+        question_block = json.dumps(
+            [{"id": q["id"], "pergunta": q["text"], "tipo": q["type"]} for _, q in pending],
+            ensure_ascii=False, indent=2
+        )
+        tail = f"""
+        Responda a TODAS as perguntas abaixo.
+
+        PERGUNTAS:
+        {question_block}
+
+        RESPOSTA FINAL: retorne APENAS um objeto JSON mapeando cada id para a resposta.
+        Exemplo: {{"q1": "Yes", "q2": "15"}}
+        """
+        try:
+            model, prompt = self._model_and_prompt(tail)
+            response = await asyncio.to_thread(model.generate_content, prompt)
+            raw = response.text.strip()
+            match = re.search(r"\{.*\}", raw, re.DOTALL)
+            parsed = json.loads(match.group(0)) if match else {}
+        except Exception as e:
+            print(f"❌ [AI] Batch error: {e}")
+            parsed = {}
+
+        for key, q in pending:
+            answer = parsed.get(q["id"])
+            if isinstance(answer, (int, float)):
+                answer = str(answer)
+            if isinstance(answer, str) and answer.strip():
+                answer = answer.strip().strip('"').strip("'")
+                print(f"✅ [AI] Answer: {q['text'][:50]}... -> {answer}")
+                self._cache_put(key, q["text"], q["type"], answer)
+                answers[q["id"]] = answer
+            else:
+                # Per-field fallback keeps a bad batch from blocking the form
+                answers[q["id"]] = await self.get_ai_answer(q["text"], q["type"])
+        return answers
+
+    _LABEL_SELECTOR = ".fb-dash-form-element__label, label"
+
+    # One evaluate_all() call scans every label, resolves its input and tags
+    # it with data-aa-id. The old Python-side loop needed ~6 round-trips to
+    # the browser per label (inner_text, get_attribute, query_selector, ...).
+    _SCAN_FORM_JS = """
+    (labels, skipLabels) => {
+        const skip = new Set(skipLabels);
+        const fields = [];
+        for (const label of labels) {
+            const text = label.innerText.trim();
+            if (!text || text.length < 3 || skip.has(text)) continue;
+
+            let target = null;
+            const forAttr = label.getAttribute('for');
+            if (forAttr) target = document.getElementById(forAttr);
+            if (!target && label.parentElement) {
+                target = label.parentElement.querySelector('input, select, textarea');
+            }
+            if (!target || target.dataset.aaId) continue;
 
-            # Try to find the associated input/select
-            for_attr = await label.get_attribute("for")
-            target = None
-            if for_attr:
-                target = await self.page.query_selector(f"#{for_attr}")
-            
+            const tag = target.tagName.toLowerCase();
+            let type = null;
+            if (tag === 'input' && ['text', 'number'].includes(target.type)) {
+                if (!target.value) type = 'text';
+            } else if (tag === 'select') {
+                type = 'select';
+            } else if (tag === 'textarea') {
+                type = 'textarea';
+            }
+            if (!type) continue;
+
+            const id = 'q' + fields.length;
+            target.dataset.aaId = id;
+            fields.push({id: id, text: text, type: type, tag: tag});
+        }
+        return fields;
+    }
+    """
+
+    async def process_form(self, page=None):
+        """Scan page for questions and fill them"""
+        page = page or self.page
+        fields = await page.locator(self._LABEL_SELECTOR).evaluate_all(
+            self._SCAN_FORM_JS, list(_SKIP_LABELS)
+        )
+        if not fields:
+            return
+
+        # One batched LLM call, then fill everything
+        answers = await self.get_ai_answers_batch(
+            [{"id": f["id"], "text": f["text"], "type": f["type"]} for f in fields]
+        )
+        for field in fields:
+            answer = answers.get(field["id"])
+            if not answer:
+                continue
+            target = await page.query_selector(f'[data-aa-id="{field["id"]}"]')
             if not target:
-                # Try sibling or parent-child relationship
-                parent = await label.query_selector("xpath=..")
-                target = await parent.query_selector("input, select, textarea")
-
-            if target:
-                tag_name = await target.evaluate("el => el.tagName.toLowerCase()")
-                input_type = await target.get_attribute("type")
-
-                if tag_name == "input" and input_type in ["text", "number"]:
-                    # Check if already filled
-                    val = await target.get_attribute("value")
-                    if not val:
-                        answer = await self.get_ai_answer(text, "text")
-                        await self.human_type(target, answer)
-                
-                elif tag_name == "select":
-                    answer = await self.get_ai_answer(text, "select")
-                    # Select by visible text or value (AI should return the best match)
-                    await target.select_option(label=answer)
-                
-                elif tag_name == "textarea":
-                    answer = await self.get_ai_answer(text, "textarea")
-                    await self.human_type(target, answer)
-
-    async def next_or_submit(self):
+                continue
+            if field["tag"] == "select":
+                # Select by visible text or value (AI should return the best match)
+                await target.select_option(label=answer)
+            else:
+                await self.human_type(target, answer)
+
+    async def _wait_for_step(self, page):
+        """Wait until the next application step is actionable.
+
+        Replaces the old fixed 2s sleeps — returns as soon as the modal/form
+        renders (typically ~300ms), with a hard cap so a stuck page can't
+        hang the loop.
+        """
+        try:
+            await page.wait_for_load_state("domcontentloaded")
+            await page.wait_for_selector(_STEP_READY_SELECTOR, timeout=8000)
+        except Exception:
+            pass  # keep going; the next scan/click will see whatever loaded
+
+    async def next_or_submit(self, page=None):
         """Click 'Next', 'Review', or 'Submit application'"""
-        buttons = await self.page.query_selector_all("button")
-        for btn in buttons:
-            text = await btn.inner_text()
-            if any(word in text.lower() for word in ["next", "review", "submit"]):
-                print(f"🖱️ [APPLIER] Clicking: {text}")
-                await btn.click()
-                await asyncio.sleep(2)
-                return True
-        return False
+        page = page or self.page
+        # Role locator resolves in one query instead of pulling the text of
+        # every button on the page back to Python
+        btn = page.get_by_role("button", name=_SUBMIT_RE).first
+        try:
+            text = await btn.inner_text(timeout=3000)
+        except Exception:
+            return False
+        print(f"🖱️ [APPLIER] Clicking: {text}")
+        await btn.click()
+        await self._wait_for_step(page)
+        return True
 
-    async def run(self, job_url):
-        await self.init_browser()
-        await self.page.goto(job_url)
+    async def _apply_on_page(self, page, job_url):
+        """Run one full Easy Apply flow on the given page/tab."""
+        await page.goto(job_url)
         print(f"📍 [APPLIER] Navigated to job: {job_url}")
-        
+
         # Wait for "Easy Apply" or the form to appear
         # If Easy Apply button exists, click it
-        easy_apply_btn = await self.page.query_selector("button:has-text('Easy Apply')")
+        easy_apply_btn = await page.query_selector("button:has-text('Easy Apply')")
         if easy_apply_btn:
             await easy_apply_btn.click()
-            await asyncio.sleep(2)
+            await self._wait_for_step(page)
 
         # Loop through pages of the application
         max_steps = 10
         for i in range(max_steps):
             print(f"📝 [APPLIER] Processing step {i+1}...")
-            await self.process_form()
-            
+            await self.process_form(page)
+
             # Check for deal-breaker logic here if needed
             # ...
 
-            success = await self.next_or_submit()
+            success = await self.next_or_submit(page)
             if not success:
                 print("🏁 [APPLIER] No more buttons found or application finished.")
                 break
-            
+
             # Check if we are done (Submit clicked)
-            # LinkedIn often shows a "Your application was sent" message
-            if "submitted" in await self.page.content():
+            # LinkedIn often shows a "Your application was sent" message.
+            # Targeted locator check runs in the browser — the old
+            # page.content() scan serialized the whole DOM every step.
+            try:
+                done = await page.locator(
+                    "h2:has-text('Your application was sent'), :text('submitted')"
+                ).first.is_visible(timeout=500)
+            except Exception:
+                done = False
+            if done:
                 print("🎉 [APPLIER] Application submitted successfully!")
                 break
 
+    async def run(self, job_url):
+        await self.init_browser()
+        await self._apply_on_page(self.page, job_url)
+
+    async def run_many(self, job_urls, max_parallel=3):
+        """Apply to several jobs concurrently, sharing one logged-in context.
+
+        Producer/consumer: URLs go into an asyncio.Queue and max_parallel
+        worker coroutines each keep one tab busy, pulling the next job the
+        moment they finish. Because the LLM calls run in worker threads and
+        page loads are awaited, a worker's Gemini round-trip overlaps the
+        other workers' navigations instead of stacking serially.
+        """
+        await self.init_browser()
+        if not self.context:
+            return
+        queue = asyncio.Queue()
+        for url in job_urls:
+            queue.put_nowait(url)
+
+        async def _worker(worker_id):
+            while True:
+                try:
+                    job_url = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                page = await self.context.new_page()
+                try:
+                    await self._apply_on_page(page, job_url)
+                except Exception as e:
+                    print(f"❌ [APPLIER] Worker {worker_id} failed on {job_url}: {e}")
+                finally:
+                    await page.close()
+                    queue.task_done()
+
+        await asyncio.gather(*[_worker(i) for i in range(max_parallel)])
+        print(f"🏁 [APPLIER] Finished batch of {len(job_urls)} jobs.")
+
     async def shutdown(self):
         if self.context:
             await self.context.close()
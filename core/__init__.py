@@ -1,60 +1,49 @@
 #!/usr/bin/env python3
 """
 ANTIGRAVITY TAILOR - Core Package
-"""
 
-from .models import (
-    Language,
-    Seniority,
-    OutputFormat,
-    MatchTier,
-    JobValidation,
-    Job,
-    JobStatus,
-    StrategicPlan,
-    ExperienceMatch,
-    MatchResult,
-    ResumeOutput,
-    PipelineState
-)
+Re-exports são lazy (PEP 562): importar `core` não carrega models/config
+(e o dotenv que config puxa) até o primeiro acesso real a um nome.
+"""
 
-from .config import (
-    BASE_DIR,
-    DATA_DIR,
-    OUTPUT_DIR,
-    JOBS_DIR,
-    TEMPLATES_DIR,
-    MASTER_CV_PT,
-    MASTER_CV_EN,
-    MASTER_CV_JUNIOR,
-    TailorConfig,
-    config
-)
+import importlib
 
-__all__ = [
-    # Enums
-    "Language",
-    "Seniority", 
-    "OutputFormat",
-    "MatchTier",
-    # Models
-    "JobValidation",
-    "Job",
-    "JobStatus",
-    "StrategicPlan",
-    "ExperienceMatch",
-    "MatchResult",
-    "ResumeOutput",
-    "PipelineState",
+_LAZY = {
+    # Enums / Models
+    "Language": "core.models",
+    "Seniority": "core.models",
+    "OutputFormat": "core.models",
+    "MatchTier": "core.models",
+    "JobValidation": "core.models",
+    "Job": "core.models",
+    "JobStatus": "core.models",
+    "StrategicPlan": "core.models",
+    "ExperienceMatch": "core.models",
+    "MatchResult": "core.models",
+    "ResumeOutput": "core.models",
+    "PipelineState": "core.models",
     # Config
-    "BASE_DIR",
-    "DATA_DIR",
-    "OUTPUT_DIR",
-    "JOBS_DIR",
-    "TEMPLATES_DIR",
-    "MASTER_CV_PT",
-    "MASTER_CV_EN",
-    "MASTER_CV_JUNIOR",
-    "TailorConfig",
-    "config"
-]
+    "BASE_DIR": "core.config",
+    "DATA_DIR": "core.config",
+    "OUTPUT_DIR": "core.config",
+    "JOBS_DIR": "core.config",
+    "TEMPLATES_DIR": "core.config",
+    "MASTER_CV_PT": "core.config",
+    "MASTER_CV_EN": "core.config",
+    "MASTER_CV_JUNIOR": "core.config",
+    "TailorConfig": "core.config",
+    "config": "core.config",
+    "ensure_dirs": "core.config",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    try:
+        module = importlib.import_module(_LAZY[name])
+    except KeyError:
+        raise AttributeError(f"module 'core' has no attribute '{name}'") from None
+    value = getattr(module, name)
+    globals()[name] = value  # cache para os próximos acessos
+    return value
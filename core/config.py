@@ -22,9 +22,14 @@ OUTPUT_DIR = BASE_DIR / "output"
 JOBS_DIR = BASE_DIR / "jobs"
 TEMPLATES_DIR = BASE_DIR / "templates"
 
-# Create dirs if not exist
-OUTPUT_DIR.mkdir(exist_ok=True)
-JOBS_DIR.mkdir(exist_ok=True)
+def ensure_dirs():
+    """Cria os diretórios de saída.
+
+    Chamado pelos entry points (app, pipeline) em vez de rodar no import —
+    quem só quer um enum de `core` não paga os syscalls de mkdir.
+    """
+    OUTPUT_DIR.mkdir(exist_ok=True)
+    JOBS_DIR.mkdir(exist_ok=True)
 
 
 # ============== MASTER CV PATHS ==============
@@ -36,7 +41,7 @@ MASTER_CV_JUNIOR = DATA_DIR / "master_cv_junior.json"
 
 # ============== LLM BACKENDS ==============
 
-@dataclass
+@dataclass(slots=True)
 class LLMConfig:
     """Configuração de backends LLM"""
     # API Keys (loaded from environment)
@@ -62,7 +67,15 @@ class LLMConfig:
 
 # ============== MATCHING CONFIG ==============
 
-@dataclass
+# Frozenset compartilhado: lookup O(1) nos loops de tokenização e uma única
+# alocação para todas as instâncias de MatchingConfig
+_DEFAULT_STOPWORDS = frozenset([
+    "the", "and", "for", "with", "you", "are", "our", "will",
+    "que", "com", "para", "uma", "seu", "sua", "nos", "das", "dos"
+])
+
+
+@dataclass(slots=True)
 class MatchingConfig:
     """Configuração do engine de matching"""
     # Thresholds
@@ -81,19 +94,16 @@ class MatchingConfig:
     
     # Keywords
     min_keyword_length: int = 3
-    common_words_to_ignore: List[str] = None
-    
+    common_words_to_ignore: frozenset = None
+
     def __post_init__(self):
         if self.common_words_to_ignore is None:
-            self.common_words_to_ignore = [
-                "the", "and", "for", "with", "you", "are", "our", "will",
-                "que", "com", "para", "uma", "seu", "sua", "nos", "das", "dos"
-            ]
+            self.common_words_to_ignore = _DEFAULT_STOPWORDS
 
 
 # ============== OUTPUT CONFIG ==============
 
-@dataclass
+@dataclass(slots=True)
 class OutputConfig:
     """Configuração de output"""
     default_format: str = "pdf"
@@ -111,7 +121,7 @@ class OutputConfig:
 
 # ============== SCRAPING CONFIG ==============
 
-@dataclass
+@dataclass(slots=True)
 class ScrapingConfig:
     """Configuração de scraping"""
     timeout_seconds: int = 30
@@ -136,7 +146,15 @@ class ScrapingConfig:
 
 # ============== GLOBAL CONFIG ==============
 
-@dataclass
+# Singletons: os sub-configs são imutáveis na prática, então TailorConfig
+# reusa estas instâncias em vez de alocar quatro novas por config
+_DEFAULT_LLM = LLMConfig()
+_DEFAULT_MATCHING = MatchingConfig()
+_DEFAULT_OUTPUT = OutputConfig()
+_DEFAULT_SCRAPING = ScrapingConfig()
+
+
+@dataclass(slots=True)
 class TailorConfig:
     """Configuração global do Tailor"""
     llm: LLMConfig = None
@@ -150,13 +168,13 @@ class TailorConfig:
     
     def __post_init__(self):
         if self.llm is None:
-            self.llm = LLMConfig()
+            self.llm = _DEFAULT_LLM
         if self.matching is None:
-            self.matching = MatchingConfig()
+            self.matching = _DEFAULT_MATCHING
         if self.output is None:
-            self.output = OutputConfig()
+            self.output = _DEFAULT_OUTPUT
         if self.scraping is None:
-            self.scraping = ScrapingConfig()
+            self.scraping = _DEFAULT_SCRAPING
 
 
 # ============== DEFAULT INSTANCE ==============
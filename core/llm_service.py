@@ -18,13 +18,79 @@ Usage:
 import os
 import time
 import json
+import hashlib
 import logging
+import random
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Optional, List, Dict, Any, Callable
 from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
 
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    _REQUESTS_AVAILABLE = True
+except ImportError:
+    requests = None
+    HTTPAdapter = None
+    _REQUESTS_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Extractors for JSON embedded in LLM responses, compiled once
+_JSON_ARRAY_RE = re.compile(r'\[.*?\]', re.DOTALL)
+_JSON_NESTED_ARRAY_RE = re.compile(r'\[\s*\[.*\]\s*\]', re.DOTALL)
+
+
+# ============== RESPONSE CACHE ==============
+
+# Calls with temperature at or below this are considered deterministic
+# enough to cache (extract_keywords runs at 0.3)
+CACHEABLE_TEMPERATURE = 0.3
+
+
+class _ResponseCache:
+    """LRU + TTL cache for deterministic LLM calls.
+
+    Identical low-temperature prompts (e.g. re-extracting keywords from the
+    same JD) skip the network entirely on a hit.
+    """
+
+    def __init__(self, maxsize: int = 512, ttl_seconds: int = 3600):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._data: OrderedDict = OrderedDict()  # key -> (expires_at, value)
+        # generate_many espalha generate() por threads que compartilham o
+        # cache; sem lock, duas threads no mesmo key expirado alcançam o
+        # del e a segunda estoura KeyError
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry:
+                expires_at, value = entry
+                if time.time() < expires_at:
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: str, value: str):
+        with self._lock:
+            self._data[key] = (time.time() + self.ttl_seconds, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
 
 # ============== CONFIG ==============
 
@@ -68,6 +134,16 @@ GROQ_CONFIG = LLMBackendConfig(
     use_cases=["fallback", "synthesis", "analysis"]
 )
 
+# Per-use-case generation defaults: small tasks shouldn't inherit the
+# backend-wide worst-case max_tokens (keyword extraction emits ~30 tokens;
+# the token budget translates directly into decode wall-clock)
+USE_CASE_DEFAULTS: Dict[str, Dict[str, Any]] = {
+    "keywords": {"max_tokens": 256, "temperature": 0.1},
+    "scoring": {"max_tokens": 128, "temperature": 0.0},
+    "filtering": {"max_tokens": 128, "temperature": 0.0},
+    "tailoring": {"max_tokens": 2048},
+}
+
 CLAUDE_CONFIG = LLMBackendConfig(
     name="claude",
     model="claude-sonnet-4-20250514",
@@ -79,6 +155,39 @@ CLAUDE_CONFIG = LLMBackendConfig(
 )
 
 
+# ============== BACKEND HEALTH CACHE ==============
+
+# Probe results persisted across processes: CLI tools construct a fresh
+# LLMService per run and shouldn't re-pay the Ollama health checks each time
+_HEALTH_PATH = Path(os.path.expanduser("~/.antigravity/backend_health.json"))
+_HEALTH_TTL_SECONDS = 300
+
+# Rolling latency per backend/use_case, persisted across runs; a backend
+# whose EWMA exceeds this is tried after its faster peers (an Ollama model
+# unloaded from VRAM can take 30s+ to first token)
+_LATENCY_PATH = Path(os.path.expanduser("~/.antigravity/backend_latency.json"))
+_SLOW_BACKEND_THRESHOLD = 10.0
+
+
+def _load_health() -> Dict[str, Any]:
+    try:
+        with open(_HEALTH_PATH, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def _save_health(name: str, entry: Dict[str, Any]):
+    try:
+        data = _load_health()
+        data[name] = entry
+        _HEALTH_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(_HEALTH_PATH, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+    except OSError as e:
+        logger.debug(f"Could not persist backend health: {e}")
+
+
 # ============== RETRY WITH EXPONENTIAL BACKOFF ==============
 
 def retry_with_backoff(
@@ -90,26 +199,39 @@ def retry_with_backoff(
 ) -> tuple:
     """
     Execute function with exponential backoff retry.
-    
+
     Returns:
-        (result, retries, error)
+        (result, retries, error) — error is the last exception raised (or
+        None), so callers can inspect e.response for HTTP status/headers.
     """
     retries = 0
     last_error = None
-    
+
     while retries <= max_retries:
         try:
             result = func()
             return (result, retries, None)
         except exceptions as e:
-            last_error = str(e)
+            last_error = e
             retries += 1
             
             if retries > max_retries:
                 break
             
-            # Exponential backoff: 1s, 2s, 4s, 8s...
-            delay = min(base_delay * (2 ** (retries - 1)), max_delay)
+            # Exponential backoff with jitter: parallel jobs hitting the
+            # same 429 must not retry in lock-step
+            delay = min(base_delay * (2 ** (retries - 1)) + random.uniform(0, base_delay), max_delay)
+
+            # If the server said when to come back, trust it over our guess
+            response = getattr(e, "response", None)
+            if response is not None:
+                retry_after = response.headers.get("Retry-After")
+                if retry_after:
+                    try:
+                        delay = min(float(retry_after), max_delay)
+                    except ValueError:
+                        pass
+
             logger.warning(f"Retry {retries}/{max_retries} after {delay:.1f}s: {last_error}")
             time.sleep(delay)
     
@@ -124,8 +246,47 @@ class LLMBackend(ABC):
     def __init__(self, config: LLMBackendConfig):
         self.config = config
         self.available = False
+        # supports_use_case roda no hot path de ordenação de backends;
+        # frozenset torna o membership O(1) e o "fallback" vira um bool fixo
+        self._use_case_set = frozenset(config.use_cases)
+        self._is_fallback = "fallback" in self._use_case_set
+        # After a 429, don't touch this backend again until the timestamp
+        # elapses — failover should cost microseconds, not a doomed request
+        self.cooldown_until: float = 0.0
+        # One Session per backend: keep-alive connections skip the TCP+TLS
+        # handshake (~150-300ms against the hosted APIs) on every call after
+        # the first
+        if not _REQUESTS_AVAILABLE:
+            logger.warning(f"requests not installed — {config.name} backend disabled")
+            self._session = None
+            return
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=8, max_retries=0)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
         self._check_availability()
-    
+
+    def close(self):
+        """Release pooled connections"""
+        try:
+            if self._session is not None:
+                self._session.close()
+        except Exception:
+            pass
+
+    def _note_rate_limit(self, error):
+        """Start a cooldown if the error was an HTTP 429."""
+        response = getattr(error, "response", None)
+        if response is None or getattr(response, "status_code", None) != 429:
+            return
+        retry_after = response.headers.get("Retry-After")
+        try:
+            delay = float(retry_after) if retry_after else 60.0
+        except ValueError:
+            delay = 60.0
+        self.cooldown_until = time.time() + delay
+        logger.warning(f"⏳ {self.config.name} rate-limited, cooling down for {delay:.0f}s")
+
     @abstractmethod
     def _check_availability(self) -> bool:
         """Check if backend is available"""
@@ -138,7 +299,7 @@ class LLMBackend(ABC):
     
     def supports_use_case(self, use_case: str) -> bool:
         """Check if backend supports a specific use case"""
-        return use_case in self.config.use_cases or "fallback" in self.config.use_cases
+        return self._is_fallback or use_case in self._use_case_set
 
 
 # ============== OLLAMA BACKEND ==============
@@ -147,17 +308,32 @@ class OllamaBackend(LLMBackend):
     """Local Ollama backend - $0 cost"""
 
     def _check_availability(self) -> bool:
+        # Warm path: a recent probe result on disk skips up to 7s of HTTP
+        cached = _load_health().get("ollama", {})
+        if (cached.get("model") == self.config.model
+                and time.time() - cached.get("ts", 0) < _HEALTH_TTL_SECONDS):
+            self.available = cached.get("available", False)
+            if self.available:
+                logger.info(f"✅ Ollama available (cached probe): {self.config.model}")
+            return self.available
+
+        result = self._probe()
+        _save_health("ollama", {
+            "available": result, "model": self.config.model, "ts": time.time()
+        })
+        return result
+
+    def _probe(self) -> bool:
         try:
-            import requests
             # First check if Ollama server is running
-            response = requests.get(
+            response = self._session.get(
                 f"{self.config.base_url}/api/tags",
                 timeout=2
             )
             if response.status_code == 200:
                 # Try to verify model exists via /api/show (more reliable than /api/tags)
                 try:
-                    show_response = requests.post(
+                    show_response = self._session.post(
                         f"{self.config.base_url}/api/show",
                         json={"name": self.config.model},
                         timeout=5
@@ -191,30 +367,48 @@ class OllamaBackend(LLMBackend):
     def generate(self, prompt: str, **kwargs) -> Optional[str]:
         if not self.available:
             return None
-        
+
+        # Sem API de cache no Ollama: o prefixo vira parte do prompt mesmo
+        if kwargs.get("cache_prefix"):
+            prompt = kwargs["cache_prefix"] + prompt
+
         try:
-            import requests
-            
             def _request():
-                response = requests.post(
+                # stream=True: chunks arrive as they're generated instead of
+                # the server buffering the whole response first
+                response = self._session.post(
                     f"{self.config.base_url}/api/generate",
                     json={
                         "model": self.config.model,
                         "prompt": prompt,
-                        "stream": False,
+                        "stream": True,
+                        **({"format": "json"} if kwargs.get("json_mode") else {}),
                         "options": {
                             "temperature": kwargs.get("temperature", self.config.temperature),
                             "num_predict": kwargs.get("max_tokens", self.config.max_tokens)
                         }
                     },
-                    timeout=self.config.timeout_seconds
+                    timeout=self.config.timeout_seconds,
+                    stream=True
                 )
                 response.raise_for_status()
-                return response.json().get("response", "")
+                chunks = []
+                try:
+                    for line in response.iter_lines():
+                        if not line:
+                            continue
+                        data = json.loads(line)
+                        chunks.append(data.get("response", ""))
+                        if data.get("done"):
+                            break
+                finally:
+                    response.close()
+                return "".join(chunks)
             
             result, retries, error = retry_with_backoff(_request, max_retries=2)
             
             if error:
+                self._note_rate_limit(error)
                 logger.error(f"Ollama generation failed: {error}")
                 return None
             
@@ -245,19 +439,24 @@ class GeminiBackend(LLMBackend):
             return None
         
         try:
-            import requests
-            
+            # Gemini 2.x faz caching implícito de prefixos repetidos: basta
+            # mandar o prefixo estático sempre como primeira part, byte a
+            # byte idêntico, que os tokens dele saem com desconto de cache
+            cache_prefix = kwargs.get("cache_prefix")
+            parts = [{"text": cache_prefix}, {"text": prompt}] if cache_prefix else [{"text": prompt}]
+
             def _request():
                 url = f"{self.config.base_url}/models/{self.config.model}:generateContent"
-                
-                response = requests.post(
+
+                response = self._session.post(
                     url,
                     params={"key": self.api_key},
                     json={
-                        "contents": [{"parts": [{"text": prompt}]}],
+                        "contents": [{"parts": parts}],
                         "generationConfig": {
                             "temperature": kwargs.get("temperature", self.config.temperature),
-                            "maxOutputTokens": kwargs.get("max_tokens", self.config.max_tokens)
+                            "maxOutputTokens": kwargs.get("max_tokens", self.config.max_tokens),
+                            **({"responseMimeType": "application/json"} if kwargs.get("json_mode") else {})
                         }
                     },
                     timeout=self.config.timeout_seconds
@@ -276,6 +475,7 @@ class GeminiBackend(LLMBackend):
             result, retries, error = retry_with_backoff(_request, max_retries=2)
             
             if error:
+                self._note_rate_limit(error)
                 logger.error(f"Gemini generation failed: {error}")
                 return None
             
@@ -305,11 +505,13 @@ class GroqBackend(LLMBackend):
         if not self.available:
             return None
 
-        try:
-            import requests
+        # Groq não expõe prompt caching: prefixo entra inline no prompt
+        if kwargs.get("cache_prefix"):
+            prompt = kwargs["cache_prefix"] + prompt
 
+        try:
             def _request():
-                response = requests.post(
+                response = self._session.post(
                     f"{self.config.base_url}/chat/completions",
                     headers={
                         "Authorization": f"Bearer {self.api_key}",
@@ -319,7 +521,8 @@ class GroqBackend(LLMBackend):
                         "model": self.config.model,
                         "messages": [{"role": "user", "content": prompt}],
                         "temperature": kwargs.get("temperature", self.config.temperature),
-                        "max_tokens": kwargs.get("max_tokens", self.config.max_tokens)
+                        "max_tokens": kwargs.get("max_tokens", self.config.max_tokens),
+                        **({"response_format": {"type": "json_object"}} if kwargs.get("json_mode") else {})
                     },
                     timeout=self.config.timeout_seconds
                 )
@@ -334,6 +537,7 @@ class GroqBackend(LLMBackend):
             result, retries, error = retry_with_backoff(_request, max_retries=2)
 
             if error:
+                self._note_rate_limit(error)
                 logger.error(f"Groq generation failed: {error}")
                 return None
 
@@ -364,20 +568,34 @@ class ClaudeBackend(LLMBackend):
             return None
 
         try:
-            import requests
+            headers = {
+                "x-api-key": self.api_key,
+                "anthropic-version": "2023-06-01",
+                "Content-Type": "application/json"
+            }
+
+            # Prompt caching: o prefixo estático (instruções + master CV) é
+            # marcado como ephemeral e a Anthropic reusa o KV-cache dele nas
+            # chamadas seguintes — só o tail variável é reprocessado
+            cache_prefix = kwargs.get("cache_prefix")
+            if cache_prefix:
+                headers["anthropic-beta"] = "prompt-caching-2024-07-31"
+                content = [
+                    {"type": "text", "text": cache_prefix,
+                     "cache_control": {"type": "ephemeral"}},
+                    {"type": "text", "text": prompt},
+                ]
+            else:
+                content = prompt
 
             def _request():
-                response = requests.post(
+                response = self._session.post(
                     f"{self.config.base_url}/messages",
-                    headers={
-                        "x-api-key": self.api_key,
-                        "anthropic-version": "2023-06-01",
-                        "Content-Type": "application/json"
-                    },
+                    headers=headers,
                     json={
                         "model": self.config.model,
                         "max_tokens": kwargs.get("max_tokens", self.config.max_tokens),
-                        "messages": [{"role": "user", "content": prompt}]
+                        "messages": [{"role": "user", "content": content}]
                     },
                     timeout=self.config.timeout_seconds
                 )
@@ -394,6 +612,7 @@ class ClaudeBackend(LLMBackend):
             result, retries, error = retry_with_backoff(_request, max_retries=2)
 
             if error:
+                self._note_rate_limit(error)
                 logger.error(f"Claude generation failed: {error}")
                 return None
 
@@ -416,8 +635,49 @@ class LLMService:
     def __init__(self, backend_order: List[str] = None):
         self.backends: Dict[str, LLMBackend] = {}
         self.backend_order = backend_order or ["ollama", "gemini", "groq", "claude"]
-
-        self._init_backends()
+        self._cache = _ResponseCache()
+        try:
+            with open(_LATENCY_PATH, 'r', encoding='utf-8') as f:
+                self._latency_ewma: Dict[str, float] = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            self._latency_ewma = {}
+
+        # Backends are probed lazily on first use: constructing the service
+        # (e.g. just to inspect configs) shouldn't pay the availability checks
+        self._initialized = False
+        self._init_lock = threading.Lock()
+        # Serializa o update do EWMA + rewrite do JSON entre as threads
+        # do generate_many
+        self._latency_lock = threading.Lock()
+
+    def _ensure_backends(self):
+        """Initialize backends once, thread-safely (double-checked)"""
+        if self._initialized:
+            return
+        with self._init_lock:
+            if not self._initialized:
+                self._init_backends()
+                self._initialized = True
+
+    def _update_latency(self, backend_name: str, use_case: str, elapsed: float):
+        """EWMA update (0.8 old / 0.2 new), persisted for the next process"""
+        key = f"{backend_name}:{use_case}"
+        with self._latency_lock:
+            prev = self._latency_ewma.get(key)
+            self._latency_ewma[key] = elapsed if prev is None else 0.8 * prev + 0.2 * elapsed
+            try:
+                _LATENCY_PATH.parent.mkdir(parents=True, exist_ok=True)
+                with open(_LATENCY_PATH, 'w', encoding='utf-8') as f:
+                    json.dump(self._latency_ewma, f)
+            except OSError:
+                pass
+
+    def _demote_slow_backends(self, order: List[str], use_case: str) -> List[str]:
+        """Stable sort: keep the cost order, but push backends whose rolling
+        latency blew past the threshold behind their faster peers."""
+        def is_slow(name: str) -> bool:
+            return self._latency_ewma.get(f"{name}:{use_case}", 0.0) > _SLOW_BACKEND_THRESHOLD
+        return sorted(order, key=is_slow)
 
     def _init_backends(self):
         """Initialize all configured backends"""
@@ -428,19 +688,30 @@ class LLMService:
             "groq": (GroqBackend, GROQ_CONFIG)
         }
         
-        for name in self.backend_order:
-            if name in backend_configs:
-                backend_class, config = backend_configs[name]
+        # Each constructor runs its availability probe (blocking I/O for
+        # Ollama), so init them concurrently: startup costs max(probe times)
+        # instead of the sum
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = {
+                name: pool.submit(backend_configs[name][0], backend_configs[name][1])
+                for name in self.backend_order if name in backend_configs
+            }
+            # Fill self.backends in backend_order so fallback iteration
+            # keeps its priority sequence
+            for name in self.backend_order:
+                if name not in futures:
+                    continue
                 try:
-                    self.backends[name] = backend_class(config)
+                    self.backends[name] = futures[name].result()
                 except Exception as e:
                     logger.warning(f"Failed to initialize {name}: {e}")
-        
+
         available = [n for n, b in self.backends.items() if b.available]
         logger.info(f"LLM backends available: {available}")
     
     def get_available_backends(self) -> List[str]:
         """Get list of available backend names"""
+        self._ensure_backends()
         return [n for n, b in self.backends.items() if b.available]
     
     def generate(
@@ -457,11 +728,38 @@ class LLMService:
             prompt: The prompt to send
             use_case: Type of task (keywords, synthesis, etc.)
             preferred_backend: Force a specific backend
-            **kwargs: Additional params (temperature, max_tokens)
+            **kwargs: Additional params (temperature, max_tokens, json_mode —
+                asks backends with native JSON output to skip prose entirely;
+                cache_prefix — static prompt prefix reused across calls,
+                server-side cached where the backend supports it)
         
         Returns:
             Generated text or None if all backends fail
         """
+        self._ensure_backends()
+
+        # Use-case defaults first, explicit kwargs win
+        defaults = USE_CASE_DEFAULTS.get(use_case)
+        if defaults:
+            kwargs = {**defaults, **kwargs}
+
+        # Deterministic calls short-circuit on the response cache
+        cache_key = None
+        if kwargs.get("temperature", 0.7) <= CACHEABLE_TEMPERATURE:
+            cache_key = hashlib.sha256(json.dumps({
+                "prompt": prompt,
+                "use_case": use_case,
+                "preferred_backend": preferred_backend,
+                "temperature": kwargs.get("temperature"),
+                "max_tokens": kwargs.get("max_tokens"),
+                "json_mode": kwargs.get("json_mode", False),
+                "cache_prefix": kwargs.get("cache_prefix"),
+            }, sort_keys=True).encode()).hexdigest()
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                logger.debug("Response cache hit")
+                return cached
+
         # Determine backend order
         if preferred_backend and preferred_backend in self.backends:
             order = [preferred_backend] + [b for b in self.backend_order if b != preferred_backend]
@@ -471,25 +769,96 @@ class LLMService:
                      if n in self.backends and self.backends[n].supports_use_case(use_case)]
             others = [n for n in self.backend_order if n not in suited]
             order = suited + others
-        
+
+        order = self._demote_slow_backends(order, use_case)
+
         # Try each backend in order
         for backend_name in order:
             backend = self.backends.get(backend_name)
             if not backend or not backend.available:
                 continue
-            
+            if time.time() < backend.cooldown_until:
+                logger.debug(f"Skipping {backend_name} (rate-limit cooldown)")
+                continue
+
             logger.debug(f"Trying {backend_name} for use_case: {use_case}")
             
+            start = time.time()
             result = backend.generate(prompt, **kwargs)
             if result:
+                self._update_latency(backend_name, use_case, time.time() - start)
                 logger.info(f"✅ Generated via {backend_name}")
+                if cache_key:
+                    self._cache.put(cache_key, result)
                 return result
-            
+
             logger.warning(f"⚠️ {backend_name} failed, trying next...")
-        
+
         logger.error("❌ All LLM backends failed")
         return None
+
+    def generate_many(
+        self,
+        prompts: List[str],
+        use_case: str = "general",
+        max_concurrency: int = 4,
+        **kwargs
+    ) -> List[Optional[str]]:
+        """
+        Fire several independent prompts concurrently.
+
+        Tailoring flows need a handful of separate calls (summary,
+        per-experience bullets, skill rewrites) that were running back to
+        back. The calls are network-bound, so a small thread pool overlaps
+        them; max_concurrency stays modest to respect provider rate caps.
+        The backend sessions already pool connections, so threads reuse
+        warm sockets.
+
+        Returns:
+            One result (or None) per prompt, same order.
+        """
+        if not prompts:
+            return []
+        if len(prompts) == 1:
+            return [self.generate(prompts[0], use_case=use_case, **kwargs)]
+
+        self._ensure_backends()
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(prompts))) as pool:
+            futures = [
+                pool.submit(self.generate, prompt, use_case=use_case, **kwargs)
+                for prompt in prompts
+            ]
+            return [f.result() for f in futures]
+
+    def close(self):
+        """Close every backend's pooled connections"""
+        for backend in self.backends.values():
+            backend.close()
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Hit/miss counters of the response cache"""
+        return {
+            "hits": self._cache.hits,
+            "misses": self._cache.misses,
+            "size": len(self._cache._data),
+        }
     
+    @staticmethod
+    def _parse_json_payload(result: str, fallback_re: re.Pattern) -> Any:
+        """Parse a JSON payload from an LLM response.
+
+        Com json_mode os backends devolvem JSON puro — parse direto, sem
+        varrer o texto. O regex fica como fallback para backends sem modo
+        JSON nativo (Claude) ou respostas com prosa em volta.
+        """
+        try:
+            return json.loads(result)
+        except json.JSONDecodeError:
+            match = fallback_re.search(result)
+            if match:
+                return json.loads(match.group())
+            return None
+
     def extract_keywords(self, text: str) -> List[str]:
         """
         Extract keywords from text using local LLM if available.
@@ -506,31 +875,104 @@ Text:
 Example output: ["python", "machine learning", "product management"]
 """
         
-        result = self.generate(prompt, use_case="keywords", temperature=0.3)
-        
+        result = self.generate(prompt, use_case="keywords", temperature=0.3, json_mode=True)
+
         if result:
             try:
-                # Extract JSON array from response
-                import re
-                match = re.search(r'\[.*?\]', result, re.DOTALL)
-                if match:
-                    keywords = json.loads(match.group())
-                    return [k.lower().strip() for k in keywords if isinstance(k, str)]
+                keywords = self._parse_json_payload(result, _JSON_ARRAY_RE)
+                if isinstance(keywords, list):
+                    # dict.fromkeys: dedupe preservando a ordem, sem O(N²)
+                    return list(dict.fromkeys(
+                        k.lower().strip() for k in keywords
+                        if isinstance(k, str) and k.strip()
+                    ))
             except (json.JSONDecodeError, Exception) as e:
                 logger.warning(f"Failed to parse keywords JSON: {e}")
-        
+
         return []
 
+    # ~6000 tokens of input per batch call (est. 4 chars/token)
+    _BATCH_CHAR_BUDGET = 24000
+
+    def extract_keywords_batch(self, texts: List[str]) -> List[List[str]]:
+        """
+        Extract keywords for several texts in as few LLM calls as possible.
+
+        One job = one LLM round-trip is the classic N+1 pattern; bulk job
+        imports were paying 1-3s per job. Texts are grouped under a token
+        budget and each group costs a single call returning a JSON
+        array-of-arrays. A group that fails to parse falls back to
+        per-item extract_keywords.
+
+        Returns:
+            One keyword list per input text, same order.
+        """
+        if not texts:
+            return []
+        if len(texts) == 1:
+            return [self.extract_keywords(texts[0])]
+
+        results: List[List[str]] = []
+        batch: List[str] = []
+        batch_chars = 0
+        for text in texts:
+            snippet = text[:3000]
+            if batch and batch_chars + len(snippet) > self._BATCH_CHAR_BUDGET:
+                results.extend(self._extract_keywords_group(batch))
+                batch, batch_chars = [], 0
+            batch.append(snippet)
+            batch_chars += len(snippet)
+        if batch:
+            results.extend(self._extract_keywords_group(batch))
+        return results
+
+    def _extract_keywords_group(self, texts: List[str]) -> List[List[str]]:
+        """One LLM call for a group of texts; per-item fallback on parse failure."""
+        if len(texts) == 1:
+            return [self.extract_keywords(texts[0])]
+
+        jd_blocks = "\n---\n".join(f"JD {i + 1}:\n{text}" for i, text in enumerate(texts))
+        prompt = f"""For each job description below, extract the most important skills, technologies, and requirements.
+Return ONLY a JSON array of arrays (one inner array per JD, in order), nothing else. Do not include any explanation.
+
+{jd_blocks}
+
+Example output for 2 JDs: [["python", "sql"], ["product management", "crm"]]
+"""
+
+        result = self.generate(prompt, use_case="keywords", temperature=0.3, max_tokens=4000, json_mode=True)
+
+        if result:
+            try:
+                parsed = self._parse_json_payload(result, _JSON_NESTED_ARRAY_RE)
+                if isinstance(parsed, list) and len(parsed) == len(texts):
+                    return [
+                        list(dict.fromkeys(
+                            k.lower().strip() for k in kws
+                            if isinstance(k, str) and k.strip()
+                        ))
+                        if isinstance(kws, list) else []
+                        for kws in parsed
+                    ]
+            except (json.JSONDecodeError, Exception) as e:
+                logger.warning(f"Failed to parse batch keywords JSON: {e}")
+
+        logger.warning("Batch keyword extraction failed, falling back to per-item calls")
+        return [self.extract_keywords(text) for text in texts]
+
 
 # ============== SINGLETON INSTANCE ==============
 
 _llm_service: Optional[LLMService] = None
+_llm_service_lock = threading.Lock()
 
 def get_llm_service() -> LLMService:
-    """Get singleton LLM service instance"""
+    """Get singleton LLM service instance (thread-safe)"""
     global _llm_service
     if _llm_service is None:
-        _llm_service = LLMService()
+        with _llm_service_lock:
+            if _llm_service is None:
+                _llm_service = LLMService()
     return _llm_service
 
 
@@ -4,11 +4,23 @@ ANTIGRAVITY TAILOR - Core Models
 Dataclasses e tipos para o pipeline
 """
 
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Any
 from enum import Enum
 from datetime import datetime
 
+# orjson serializa 3-5x mais rápido e já devolve bytes (sem cópia str->bytes)
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    import json
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
 
 class Language(Enum):
     PT = "pt"
@@ -35,6 +47,14 @@ class MatchTier(Enum):
     MEDIUM = "medium"  # 40-70% match
     LOW = "low"        # <40% match
 
+    @property
+    def rank(self) -> int:
+        """Ordem numérica (LOW=0 … HIGH=2) para comparações/sorting baratos"""
+        return _TIER_RANK[self]
+
+
+_TIER_RANK = {MatchTier.LOW: 0, MatchTier.MEDIUM: 1, MatchTier.HIGH: 2}
+
 
 class JobStatus(Enum):
     TODO = "todo"
@@ -44,7 +64,11 @@ class JobStatus(Enum):
     REJECTED = "rejected"
 
 
-@dataclass
+# Lookup direto valor -> enum: evita o custo de try/except em from_dict
+_STATUS_MAP = {s.value: s for s in JobStatus}
+
+
+@dataclass(slots=True)
 class StrategicPlan:
     ghost_notes: List[str]
     vulnerability_report: List[str]
@@ -52,10 +76,20 @@ class StrategicPlan:
     suggested_narrative_shift: str
     approved: bool = False
 
+    def to_dict(self) -> Dict:
+        # Cópia manual: asdict() faz deep-copy recursivo de cada lista
+        return {
+            "ghost_notes": self.ghost_notes,
+            "vulnerability_report": self.vulnerability_report,
+            "anti_overqualification_applied": self.anti_overqualification_applied,
+            "suggested_narrative_shift": self.suggested_narrative_shift,
+            "approved": self.approved,
+        }
+
 
 # ============== JOB MODELS ==============
 
-@dataclass
+@dataclass(slots=True)
 class JobValidation:
     """Checklist de validação do scraping"""
     cargo_found: bool = False
@@ -102,9 +136,9 @@ class JobValidation:
         return "\n".join(checks)
 
 
-@dataclass
+@dataclass(slots=True)
 class Job:
-    """Estrutura de uma vaga"""
+    """Estrutura de uma vaga (slots: menos memória, acesso a atributo direto)"""
     id: str
     title: str
     company: str
@@ -145,19 +179,20 @@ class Job:
             "hard_skills": self.hard_skills,
             "soft_skills": self.soft_skills,
             "keywords_ats": self.keywords_ats,
-            "strategic_plan": asdict(self.strategic_plan) if self.strategic_plan else None,
+            "strategic_plan": self.strategic_plan.to_dict() if self.strategic_plan else None,
             "scraped_at": self.scraped_at
         }
-    
+
+    def to_json_bytes(self) -> bytes:
+        """Serialização direta para persistência em disco"""
+        return _dumps(self.to_dict())
+
+
     @classmethod
     def from_dict(cls, data: Dict) -> 'Job':
-        # Lazy status conversion
-        status_val = data.get("status", "todo")
-        try:
-            status = JobStatus(status_val)
-        except:
-            status = JobStatus.TODO
-            
+        status = _STATUS_MAP.get(data.get("status", "todo"), JobStatus.TODO)
+
+
         # Strategic plan
         strat_data = data.get("strategic_plan")
         strat_plan = None
@@ -190,7 +225,7 @@ class Job:
 
 # ============== MATCH MODELS ==============
 
-@dataclass
+@dataclass(slots=True)
 class ExperienceMatch:
     """Match de uma experiência com a vaga"""
     experience_id: int
@@ -202,7 +237,7 @@ class ExperienceMatch:
     selected_bullets: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchResult:
     """Resultado do matching CV vs Vaga"""
     total_score: float  # 0.0 a 1.0
@@ -251,7 +286,7 @@ class MatchResult:
 
 # ============== OUTPUT MODELS ==============
 
-@dataclass
+@dataclass(slots=True)
 class ResumeOutput:
     """Currículo gerado"""
     # Header
@@ -294,10 +329,14 @@ class ResumeOutput:
             "match_score": self.match_score
         }
 
+    def to_json_bytes(self) -> bytes:
+        """Serialização direta para persistência em disco"""
+        return _dumps(self.to_dict())
+
 
 # ============== PIPELINE STATE ==============
 
-@dataclass
+@dataclass(slots=True)
 class PipelineState:
     """Estado do pipeline para tracking"""
     step: str = "init"
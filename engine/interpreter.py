@@ -6,9 +6,12 @@ Análise semântica da vaga: extração de keywords, senioridade, tipo
 NÃO inventa dados. Apenas extrai o que está explícito.
 """
 
+import bisect
+import hashlib
 import re
+from collections import Counter
+from functools import lru_cache
 from typing import List, Dict, Tuple, Optional
-from dataclasses import dataclass
 
 import sys
 from pathlib import Path
@@ -21,92 +24,272 @@ from core.models import Job, Language, Seniority, JobValidation
 
 HARD_SKILLS_PATTERNS = {
     # Marketing / Growth
-    "gtm": ["gtm", "go-to-market", "go to market"],
-    "crm": ["crm", "hubspot", "salesforce", "pipedrive"],
-    "marketing_automation": ["marketing automation", "automação de marketing", "automation"],
-    "seo": ["seo", "search engine optimization"],
-    "sem": ["sem", "search engine marketing", "paid search"],
-    "google_ads": ["google ads", "adwords", "google advertising"],
-    "meta_ads": ["meta ads", "facebook ads", "instagram ads", "fb ads"],
-    "analytics": ["analytics", "ga4", "google analytics", "data analytics"],
-    "ab_testing": ["a/b testing", "ab testing", "teste ab", "split testing"],
-    "cro": ["cro", "conversion rate optimization", "otimização de conversão"],
-    "growth": ["growth", "growth hacking", "growth marketing"],
-    "brandformance": ["brandformance", "brand performance"],
-    "revops": ["revops", "revenue operations"],
-    "abm": ["abm", "account based marketing"],
-    "demand_gen": ["demand generation", "demand gen", "geração de demanda"],
-    "lead_gen": ["lead generation", "lead gen", "geração de leads"],
-    "inbound": ["inbound", "inbound marketing"],
-    "outbound": ["outbound", "outbound marketing"],
-    "content_marketing": ["content marketing", "marketing de conteúdo"],
-    "influencer": ["influencer", "influenciador"],
-    "branding": ["branding", "brand strategy", "marca"],
-    "positioning": ["positioning", "posicionamento"],
-    "product_marketing": ["product marketing", "pmm", "marketing de produto"],
+    "gtm": ("gtm", "go-to-market", "go to market"),
+    "crm": ("crm", "hubspot", "salesforce", "pipedrive"),
+    "marketing_automation": ("marketing automation", "automação de marketing", "automation"),
+    "seo": ("seo", "search engine optimization"),
+    "sem": ("sem", "search engine marketing", "paid search"),
+    "google_ads": ("google ads", "adwords", "google advertising"),
+    "meta_ads": ("meta ads", "facebook ads", "instagram ads", "fb ads"),
+    "analytics": ("analytics", "ga4", "google analytics", "data analytics"),
+    "ab_testing": ("a/b testing", "ab testing", "teste ab", "split testing"),
+    "cro": ("cro", "conversion rate optimization", "otimização de conversão"),
+    "growth": ("growth", "growth hacking", "growth marketing"),
+    "brandformance": ("brandformance", "brand performance"),
+    "revops": ("revops", "revenue operations"),
+    "abm": ("abm", "account based marketing"),
+    "demand_gen": ("demand generation", "demand gen", "geração de demanda"),
+    "lead_gen": ("lead generation", "lead gen", "geração de leads"),
+    "inbound": ("inbound", "inbound marketing"),
+    "outbound": ("outbound", "outbound marketing"),
+    "content_marketing": ("content marketing", "marketing de conteúdo"),
+    "influencer": ("influencer", "influenciador"),
+    "branding": ("branding", "brand strategy", "marca"),
+    "positioning": ("positioning", "posicionamento"),
+    "product_marketing": ("product marketing", "pmm", "marketing de produto"),
     
     # AI / Tech
-    "ai": ["ai", "artificial intelligence", "inteligência artificial", "ia"],
-    "llm": ["llm", "large language model", "gpt", "claude", "gemini"],
-    "ml": ["ml", "machine learning", "aprendizado de máquina"],
-    "python": ["python"],
-    "sql": ["sql", "mysql", "postgresql", "postgres"],
-    "docker": ["docker", "container"],
-    "n8n": ["n8n", "n8n.io"],
-    "make": ["make", "integromat"],
-    "zapier": ["zapier"],
-    "rag": ["rag", "retrieval augmented"],
-    "prompt_engineering": ["prompt engineering", "engenharia de prompt"],
+    "ai": ("ai", "artificial intelligence", "inteligência artificial", "ia"),
+    "llm": ("llm", "large language model", "gpt", "claude", "gemini"),
+    "ml": ("ml", "machine learning", "aprendizado de máquina"),
+    "python": ("python",),
+    "sql": ("sql", "mysql", "postgresql", "postgres"),
+    "docker": ("docker", "container"),
+    "n8n": ("n8n", "n8n.io"),
+    "make": ("make", "integromat"),
+    "zapier": ("zapier",),
+    "rag": ("rag", "retrieval augmented"),
+    "prompt_engineering": ("prompt engineering", "engenharia de prompt"),
     
     # Data
-    "data_analysis": ["data analysis", "análise de dados", "data-driven"],
-    "dashboard": ["dashboard", "dashboards", "tableau", "power bi", "looker"],
-    "excel": ["excel", "planilhas", "spreadsheet"],
-    "bi": ["bi", "business intelligence"],
+    "data_analysis": ("data analysis", "análise de dados", "data-driven"),
+    "dashboard": ("dashboard", "dashboards", "tableau", "power bi", "looker"),
+    "excel": ("excel", "planilhas", "spreadsheet"),
+    "bi": ("bi", "business intelligence"),
     
     # Management
-    "project_management": ["project management", "gestão de projetos", "pm"],
-    "agile": ["agile", "ágil", "scrum", "kanban"],
-    "okrs": ["okr", "okrs", "objectives and key results"],
-    "kpis": ["kpi", "kpis", "indicadores"],
-    "p_and_l": ["p&l", "p/l", "profit and loss", "lucros e perdas"],
-    "budget": ["budget", "orçamento", "budget management"],
+    "project_management": ("project management", "gestão de projetos", "pm"),
+    "agile": ("agile", "ágil", "scrum", "kanban"),
+    "okrs": ("okr", "okrs", "objectives and key results"),
+    "kpis": ("kpi", "kpis", "indicadores"),
+    "p_and_l": ("p&l", "p/l", "profit and loss", "lucros e perdas"),
+    "budget": ("budget", "orçamento", "budget management"),
 }
 
 SOFT_SKILLS_PATTERNS = {
-    "leadership": ["liderança", "leadership", "líder", "leader", "liderar"],
-    "communication": ["comunicação", "communication", "apresentação", "presentation"],
-    "teamwork": ["trabalho em equipe", "teamwork", "equipe", "team"],
-    "stakeholder": ["stakeholder", "stakeholders", "partes interessadas"],
-    "negotiation": ["negociação", "negotiation", "negociar"],
-    "strategic": ["estratégico", "strategic", "estratégia", "strategy"],
-    "analytical": ["analítico", "analytical", "análise crítica"],
-    "problem_solving": ["resolução de problemas", "problem solving"],
-    "proactive": ["proativo", "proactive", "iniciativa"],
-    "adaptable": ["adaptável", "adaptable", "flexível", "flexible"],
+    "leadership": ("liderança", "leadership", "líder", "leader", "liderar"),
+    "communication": ("comunicação", "communication", "apresentação", "presentation"),
+    "teamwork": ("trabalho em equipe", "teamwork", "equipe", "team"),
+    "stakeholder": ("stakeholder", "stakeholders", "partes interessadas"),
+    "negotiation": ("negociação", "negotiation", "negociar"),
+    "strategic": ("estratégico", "strategic", "estratégia", "strategy"),
+    "analytical": ("analítico", "analytical", "análise crítica"),
+    "problem_solving": ("resolução de problemas", "problem solving"),
+    "proactive": ("proativo", "proactive", "iniciativa"),
+    "adaptable": ("adaptável", "adaptable", "flexível", "flexible"),
 }
 
 SENIORITY_PATTERNS = {
-    Seniority.JUNIOR: ["junior", "júnior", "jr", "entry level", "iniciante", "trainee", "estágio", "estagiário"],
-    Seniority.PLENO: ["pleno", "mid", "mid-level", "intermediário"],
-    Seniority.SENIOR: ["senior", "sênior", "sr", "experienced", "experiente"],
-    Seniority.MANAGER: ["manager", "gerente", "coordenador", "coordinator", "supervisor"],
-    Seniority.LEAD: ["lead", "head", "diretor", "director", "principal", "vp", "vice president"],
+    Seniority.JUNIOR: ("junior", "júnior", "jr", "entry level", "iniciante", "trainee", "estágio", "estagiário"),
+    Seniority.PLENO: ("pleno", "mid", "mid-level", "intermediário"),
+    Seniority.SENIOR: ("senior", "sênior", "sr", "experienced", "experiente"),
+    Seniority.MANAGER: ("manager", "gerente", "coordenador", "coordinator", "supervisor"),
+    Seniority.LEAD: ("lead", "head", "diretor", "director", "principal", "vp", "vice president"),
 }
 
 JOB_TYPE_PATTERNS = {
-    "marketing": ["marketing", "mkt", "comunicação"],
-    "growth": ["growth", "aquisição", "acquisition", "performance"],
-    "branding": ["branding", "brand", "marca"],
-    "ai_ops": ["ai", "ia", "automation", "automação", "llm"],
-    "product": ["produto", "product", "pm", "apm", "gpm"],
-    "revops": ["revops", "revenue", "sales ops", "operações"],
-    "content": ["content", "conteúdo", "editorial", "mídias sociais"],
-    "crm": ["crm", "lifecycle", "retention", "retenção"],
-    "b2b": ["b2b", "enterprise", "corporativo"],
+    "marketing": ("marketing", "mkt", "comunicação"),
+    "growth": ("growth", "aquisição", "acquisition", "performance"),
+    "branding": ("branding", "brand", "marca"),
+    "ai_ops": ("ai", "ia", "automation", "automação", "llm"),
+    "product": ("produto", "product", "pm", "apm", "gpm"),
+    "revops": ("revops", "revenue", "sales ops", "operações"),
+    "content": ("content", "conteúdo", "editorial", "mídias sociais"),
+    "crm": ("crm", "lifecycle", "retention", "retenção"),
+    "b2b": ("b2b", "enterprise", "corporativo"),
 }
 
 
+# ============== COMPILED SCANNERS ==============
+
+# Acentos removidos antes do matching: os scanners casam byte único ASCII
+# (case-fold Unicode é mais caro) e viram acento-insensíveis de quebra
+# ("lideranca" sem cedilha também casa). A tradução é O(N), uma vez.
+_ACCENT_TABLE = str.maketrans(
+    "áàâãäéèêëíìîïóòôõöúùûüç",
+    "aaaaaeeeeiiiiooooouuuuc"
+)
+
+# Alternativas curtas que o folding torna ambíguas: "aí" vira "ai" e
+# casaria a skill de AI em qualquer "E aí, tudo bem?". Para estas o
+# match só vale se o texto ORIGINAL naquela posição já era o padrão
+# (translate é 1:1 por caractere, então os offsets coincidem).
+_ACCENT_EXACT = frozenset(("ai", "ia"))
+
+def _build_scanner(patterns: Dict[str, Tuple[str, ...]]) -> Tuple[re.Pattern, tuple, tuple]:
+    """
+    Funde todos os padrões de um dicionário num único regex de alternação.
+
+    Uma varredura de finditer substitui um re.search por padrão (~100 scans
+    do texto inteiro por vaga). O match é um lookahead de largura zero para
+    que skills sobrepostas continuem todas sendo reportadas ("power bi"
+    contém "bi" — consumir o match mais longo engolia o mais curto);
+    alternativas mais longas vêm primeiro para que "google analytics"
+    ganhe de "analytics" quando começam na mesma posição (mesmo id).
+
+    Cada alternativa vira um grupo próprio: match.lastindex indexa direto
+    nas tuplas de ids/padrões, sem extrair/hashear a substring casada.
+    """
+    pattern_to_id = {}
+    for skill_id, pats in patterns.items():
+        # sys.intern: comparações/hashing dos ids viram ponteiro-igual
+        skill_id = sys.intern(skill_id)
+        for pat in pats:
+            pattern_to_id[pat.translate(_ACCENT_TABLE)] = skill_id
+    ordered = sorted(pattern_to_id, key=len, reverse=True)
+    rx = re.compile(
+        r'\b(?=' + '|'.join('(' + re.escape(p) + r')\b' for p in ordered) + r')',
+        re.IGNORECASE
+    )
+    return rx, tuple(pattern_to_id[p] for p in ordered), tuple(ordered)
+
+
+_HARD_RX, _HARD_IDS, _HARD_PATS = _build_scanner(HARD_SKILLS_PATTERNS)
+_SOFT_RX, _SOFT_IDS, _SOFT_PATS = _build_scanner(SOFT_SKILLS_PATTERNS)
+
+# Scanner unificado: hard + soft + job_type numa única alternação. Cada
+# padrão carrega suas tags (bucket, id) — "growth" conta como hard skill
+# E como sinal de job_type na mesma passada.
+_KEYWORD_TAGS: Dict[str, List[Tuple[str, str]]] = {}
+for _bucket, _table in (
+    ("hard", HARD_SKILLS_PATTERNS),
+    ("soft", SOFT_SKILLS_PATTERNS),
+    ("jobtype", JOB_TYPE_PATTERNS),
+):
+    for _sid, _pats in _table.items():
+        for _pat in _pats:
+            _KEYWORD_TAGS.setdefault(_pat.translate(_ACCENT_TABLE), []).append((_bucket, sys.intern(_sid)))
+
+_KEYWORD_ORDER = sorted(_KEYWORD_TAGS, key=len, reverse=True)
+# Lookahead de largura zero (ver _build_scanner): matches sobrepostos em
+# posições diferentes são todos reportados, como nos scans por padrão.
+_KEYWORD_RX = re.compile(
+    r'\b(?=' + '|'.join('(' + re.escape(p) + r')\b' for p in _KEYWORD_ORDER) + r')',
+    re.IGNORECASE
+)
+
+
+def _is_boundary_prefix(shorter: str, longer: str) -> bool:
+    """True se `shorter` casa com \\b no início de `longer` ("content" em
+    "content marketing"). Palavra = [a-z0-9_], como no \\b do re."""
+    if not longer.startswith(shorter) or len(shorter) >= len(longer):
+        return False
+    a, b = shorter[-1], longer[len(shorter)]
+    return (a.isalnum() or a == "_") != (b.isalnum() or b == "_")
+
+
+# Padrões indexados por número de grupo, para o filtro accent-exact
+_KEYWORD_PATS = tuple(_KEYWORD_ORDER)
+
+# Na mesma posição a alternação só captura a alternativa mais longa, mas
+# um padrão mais curto que é prefixo-\b dela também casaria ali ("content
+# marketing" esconde o sinal de job_type de "content"). As tags desses
+# prefixos são absorvidas pela alternativa longa para que as contagens
+# de job_type batam com os findall por padrão que o scanner substituiu.
+_KEYWORD_TAG_TABLE = tuple(
+    tuple(dict.fromkeys(
+        _KEYWORD_TAGS[p]
+        + [t for q in _KEYWORD_TAGS if _is_boundary_prefix(q, p) for t in _KEYWORD_TAGS[q]]
+    ))
+    for p in _KEYWORD_ORDER
+)
+
+
+def _scan_keywords(text: str) -> Tuple[List[str], List[str], Counter]:
+    """
+    Uma única varredura do texto alimentando os três buckets de extração.
+
+    interpret() fazia três passadas independentes (hard, soft, job_type)
+    sobre o mesmo texto; aqui o finditer roda uma vez e as tags de cada
+    match são distribuídas para os buckets.
+    """
+    # dicts como "ordered sets": dedupe O(1) preservando a ordem do texto
+    hard: Dict[str, None] = {}
+    soft: Dict[str, None] = {}
+    jt_counts: Counter = Counter()
+    for m in _KEYWORD_RX.finditer(text.translate(_ACCENT_TABLE)):
+        g = m.lastindex
+        pat = _KEYWORD_PATS[g - 1]
+        if pat in _ACCENT_EXACT and text[m.start(g):m.end(g)] != pat:
+            continue
+        for bucket, sid in _KEYWORD_TAG_TABLE[g - 1]:
+            if bucket == "hard":
+                hard[sid] = None
+            elif bucket == "soft":
+                soft[sid] = None
+            else:
+                jt_counts[sid] += 1
+    return list(hard), list(soft), jt_counts
+
+# Todos os níveis numa única alternação com grupos nomeados; a prioridade
+# (LEAD > MANAGER > SENIOR > PLENO > JUNIOR) é resolvida pelo rank
+_SENIORITY_PRIORITY = (Seniority.LEAD, Seniority.MANAGER, Seniority.SENIOR, Seniority.PLENO, Seniority.JUNIOR)
+_SENIORITY_RANK = {s.name: i for i, s in enumerate(_SENIORITY_PRIORITY)}
+_SENIORITY_RX = re.compile(
+    '|'.join(
+        r'\b(?P<' + s.name + r'>(?:' + '|'.join(
+            # dict.fromkeys: "sênior"/"senior" colapsam na mesma alternativa
+            re.escape(p) for p in dict.fromkeys(sorted(
+                (p.translate(_ACCENT_TABLE) for p in SENIORITY_PATTERNS[s]),
+                key=len, reverse=True))
+        ) + r'))\b'
+        for s in _SENIORITY_PRIORITY
+    ),
+    re.IGNORECASE
+)
+
+# Padrões ATS compilados uma vez no import (antes: re-parse por chamada)
+_ATS_COMPILED = [
+    re.compile(r'\b(\d+\s*anos?\s*de\s*experiência|\d+\s*years?\s*experience)\b', re.IGNORECASE),
+    re.compile(r'\b(inglês|english|espanhol|spanish)\s*(fluente|avançado|advanced|native)\b', re.IGNORECASE),
+    re.compile(r'\b(remote|remoto|híbrido|hybrid|presencial|onsite)\b', re.IGNORECASE),
+]
+
+# Tokenização única do texto: membership O(1) em frozensets substitui
+# varreduras de substring (cada `word in text` era um scan completo)
+_WORD_RE = re.compile(r"[a-z0-9áàâãéêíóôõúüç&/+-]+")
+
+_PT_WORDS = frozenset(["você", "será", "nosso", "nossa", "equipe", "empresa", "requisitos", "responsabilidades"])
+_EN_WORDS = frozenset(["you", "will", "our", "team", "company", "requirements", "responsibilities"])
+
+# Acrônimos ATS: regex \b-bounded, não membership nos tokens — o token
+# class do _WORD_RE inclui /&+-, então "kpi/roi" vira UM token e os
+# acrônimos sumiriam; \b casa dentro dele ("/" não é word char).
+# findall emite em ordem do texto (determinística); dedupe no retorno.
+_ATS_ACRONYMS_RX = re.compile(r'\b(?:kpi|roi|cac|ltv|mrr|arr|nps|csat)\b')
+
+# Sondas de validação fundidas: um scan por idioma em vez de um scan de
+# substring por palavra. Lookahead sem \b preserva a semântica de
+# containment das sondas originais ("nosso" casa em "nossos", "equipe"
+# em "equipes"); ser[áã] também cobre "serão". O grupo nomeado identifica
+# a sonda: presença = nº de lastgroups distintos, como o sum(w in text).
+_PT_LANG_RX = re.compile(r'(?=(?P<voce>você)|(?P<nosso>nosso)|(?P<sera>ser[áã])|(?P<equipe>equipe))')
+_EN_LANG_RX = re.compile(r'(?=(?P<you>you)|(?P<our>our)|(?P<will>will)|(?P<team>team))')
+_REQUIREMENTS_RX = re.compile(
+    r'requisitos|requirements|qualificações|qualifications|'
+    r'experiência|experience|skills|habilidades'
+)
+
+
+# Desempate do job_type na ordem de declaração (mesma semântica do
+# max(scores, key=scores.get) sobre o dict original de contagens)
+_JOB_TYPE_ORDER = {sys.intern(k): i for i, k in enumerate(JOB_TYPE_PATTERNS)}
+
+
+def _noop(job: "Job") -> None:
+    """Caminho de debug desligado: chamada vazia, sem formatação"""
+
+
 # ============== INTERPRETER CLASS ==============
 
 class JobInterpreter:
@@ -121,6 +304,9 @@ class JobInterpreter:
     
     def __init__(self, debug: bool = False):
         self.debug = debug
+        # Dispatch direto: caminho sem debug não paga branch nem lookup
+        # do bloco de formatação por vaga
+        self._debug_fn = self._print_debug if debug else _noop
     
     def interpret(self, job: Job) -> Job:
         """
@@ -128,101 +314,143 @@ class JobInterpreter:
         Modifica o Job in-place e retorna.
         """
         text = f"{job.title} {job.description}".lower()
-        
-        # Extrair informações
-        job.hard_skills = self._extract_hard_skills(text)
-        job.soft_skills = self._extract_soft_skills(text)
-        job.keywords_ats = self._extract_ats_keywords(text)
-        job.seniority = self._detect_seniority(text)
-        job.job_type = self._detect_job_type(text)
-        job.language = self._detect_language(text)
-        
-        if self.debug:
-            self._print_debug(job)
-        
+
+        # Extração memoizada: vagas repetidas (re-scrape do mesmo board)
+        # saem do cache sem nenhuma varredura
+        hard, soft, ats, seniority, job_type, language = _interpret_text(text)
+        job.hard_skills = list(hard)
+        job.soft_skills = list(soft)
+        job.keywords_ats = list(ats)
+        job.seniority = seniority
+        job.job_type = job_type
+        job.language = language
+
+        self._debug_fn(job)
+
         return job
     
+    def interpret_many(self, jobs: List[Job]) -> List[Job]:
+        """
+        Interpreta um lote de vagas com uma única varredura do scanner.
+
+        Os textos são concatenados com um sentinela \\x00 (não-palavra, não
+        aparece em nenhum padrão) e o finditer roda uma vez sobre o blob;
+        cada match volta para sua vaga via bisect nos offsets. Amortiza o
+        overhead por chamada em lotes grandes de scraping.
+        """
+        if not jobs:
+            return jobs
+
+        texts = [f"{job.title} {job.description}".lower() for job in jobs]
+        # translate é 1:1 por caractere, então os offsets continuam válidos
+        blob_orig = "\x00".join(texts)
+        blob = blob_orig.translate(_ACCENT_TABLE)
+        offsets = []
+        pos = 0
+        for t in texts:
+            offsets.append(pos)
+            pos += len(t) + 1  # +1 pelo sentinela
+
+        per_hard: List[Dict[str, None]] = [{} for _ in jobs]
+        per_soft: List[Dict[str, None]] = [{} for _ in jobs]
+        per_jt: List[Counter] = [Counter() for _ in jobs]
+        for m in _KEYWORD_RX.finditer(blob):
+            g = m.lastindex
+            pat = _KEYWORD_PATS[g - 1]
+            if pat in _ACCENT_EXACT and blob_orig[m.start(g):m.end(g)] != pat:
+                continue
+            idx = bisect.bisect_right(offsets, m.start()) - 1
+            for bucket, sid in _KEYWORD_TAG_TABLE[g - 1]:
+                if bucket == "hard":
+                    per_hard[idx][sid] = None
+                elif bucket == "soft":
+                    per_soft[idx][sid] = None
+                else:
+                    per_jt[idx][sid] += 1
+
+        for job, text, hard, soft, jt_counts in zip(jobs, texts, per_hard, per_soft, per_jt):
+            tokens = set(_WORD_RE.findall(text))
+            job.hard_skills = list(hard)
+            job.soft_skills = list(soft)
+            job.keywords_ats = self._extract_ats_keywords(text, hard_skills=job.hard_skills)
+            job.seniority = self._detect_seniority(text)
+            job.job_type = self._job_type_from_counts(jt_counts)
+            job.language = _language_from_tokens(tokens)
+            self._debug_fn(job)
+
+        return jobs
+
     def _extract_hard_skills(self, text: str) -> List[str]:
-        """Extrai hard skills do texto"""
-        found = []
-        for skill_id, patterns in HARD_SKILLS_PATTERNS.items():
-            for pattern in patterns:
-                if re.search(rf'\b{re.escape(pattern)}\b', text, re.IGNORECASE):
-                    found.append(skill_id)
-                    break
-        return list(set(found))
-    
+        """Extrai hard skills do texto (uma passada única do scanner)"""
+        found: Dict[str, None] = {}
+        for m in _HARD_RX.finditer(text.translate(_ACCENT_TABLE)):
+            g = m.lastindex
+            pat = _HARD_PATS[g - 1]
+            if pat in _ACCENT_EXACT and text[m.start(g):m.end(g)] != pat:
+                continue
+            found[_HARD_IDS[g - 1]] = None
+        return list(found)
+
     def _extract_soft_skills(self, text: str) -> List[str]:
-        """Extrai soft skills do texto"""
-        found = []
-        for skill_id, patterns in SOFT_SKILLS_PATTERNS.items():
-            for pattern in patterns:
-                if re.search(rf'\b{re.escape(pattern)}\b', text, re.IGNORECASE):
-                    found.append(skill_id)
-                    break
-        return list(set(found))
+        """Extrai soft skills do texto (uma passada única do scanner)"""
+        return list(dict.fromkeys(
+            _SOFT_IDS[m.lastindex - 1]
+            for m in _SOFT_RX.finditer(text.translate(_ACCENT_TABLE))
+        ))
     
-    def _extract_ats_keywords(self, text: str) -> List[str]:
+    def _extract_ats_keywords(
+        self,
+        text: str,
+        hard_skills: Optional[List[str]] = None,
+    ) -> List[str]:
         """Extrai keywords para ATS matching"""
         # Combina hard + soft + palavras específicas encontradas
         keywords = []
-        
-        # Add hard skills
-        keywords.extend(self._extract_hard_skills(text))
-        
-        # Buscar padrões específicos comuns em vagas
-        ats_patterns = [
-            r'\b(kpi|roi|cac|ltv|mrr|arr|nps|csat)\b',
-            r'\b(\d+\s*anos?\s*de\s*experiência|\d+\s*years?\s*experience)\b',
-            r'\b(inglês|english|espanhol|spanish)\s*(fluente|avançado|advanced|native)\b',
-            r'\b(remote|remoto|híbrido|hybrid|presencial|onsite)\b',
-        ]
-        
-        for pattern in ats_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+
+        # Add hard skills (reusa a lista já extraída em interpret())
+        if hard_skills is None:
+            hard_skills = self._extract_hard_skills(text)
+        keywords.extend(hard_skills)
+
+        # Acrônimos (kpi, roi, ...): um findall compilado, ordem do texto
+        keywords.extend(_ATS_ACRONYMS_RX.findall(text))
+
+        # Buscar padrões específicos comuns em vagas (compilados no import)
+        for pattern in _ATS_COMPILED:
+            matches = pattern.findall(text)
             keywords.extend([m if isinstance(m, str) else m[0] for m in matches])
         
-        return list(set(keywords))
+        return list(dict.fromkeys(keywords))
     
     def _detect_seniority(self, text: str) -> Optional[Seniority]:
-        """Detecta senioridade da vaga"""
-        # Prioridade: LEAD > MANAGER > SENIOR > PLENO > JUNIOR
-        priority_order = [Seniority.LEAD, Seniority.MANAGER, Seniority.SENIOR, Seniority.PLENO, Seniority.JUNIOR]
-        
-        for seniority in priority_order:
-            patterns = SENIORITY_PATTERNS[seniority]
-            for pattern in patterns:
-                if re.search(rf'\b{re.escape(pattern)}\b', text, re.IGNORECASE):
-                    return seniority
-        
-        return None
+        """Detecta senioridade da vaga numa única passada do texto"""
+        # Prioridade: LEAD > MANAGER > SENIOR > PLENO > JUNIOR. Uma passada
+        # de finditer coleta o melhor rank; LEAD encerra cedo (rank 0).
+        best_rank = None
+        for m in _SENIORITY_RX.finditer(text.translate(_ACCENT_TABLE)):
+            rank = _SENIORITY_RANK[m.lastgroup]
+            if rank == 0:
+                return Seniority.LEAD
+            if best_rank is None or rank < best_rank:
+                best_rank = rank
+
+        return _SENIORITY_PRIORITY[best_rank] if best_rank is not None else None
     
     def _detect_job_type(self, text: str) -> str:
-        """Detecta tipo da vaga"""
-        scores = {}
-        
-        for job_type, patterns in JOB_TYPE_PATTERNS.items():
-            score = 0
-            for pattern in patterns:
-                matches = len(re.findall(rf'\b{re.escape(pattern)}\b', text, re.IGNORECASE))
-                score += matches
-            if score > 0:
-                scores[job_type] = score
-        
-        if scores:
-            return max(scores, key=scores.get)
-        return "marketing"  # default
+        """Detecta tipo da vaga (uma passada do scanner unificado)"""
+        _, _, jt_counts = _scan_keywords(text)
+        return self._job_type_from_counts(jt_counts)
+
+    def _job_type_from_counts(self, jt_counts: Counter) -> str:
+        """Resolve o job_type a partir do Counter preenchido pelo scanner"""
+        if not jt_counts:
+            return "marketing"  # default
+        # Empates vão para o tipo declarado primeiro em JOB_TYPE_PATTERNS
+        return min(jt_counts, key=lambda t: (-jt_counts[t], _JOB_TYPE_ORDER[t]))
     
     def _detect_language(self, text: str) -> Language:
         """Detecta idioma predominante"""
-        # Palavras exclusivas de cada idioma
-        pt_words = ["você", "será", "nosso", "nossa", "equipe", "empresa", "requisitos", "responsabilidades"]
-        en_words = ["you", "will", "our", "team", "company", "requirements", "responsibilities"]
-        
-        pt_count = sum(1 for word in pt_words if word in text)
-        en_count = sum(1 for word in en_words if word in text)
-        
-        return Language.EN if en_count > pt_count else Language.PT
+        return _detect_language_cached(text)
     
     def _print_debug(self, job: Job):
         """Print debug info"""
@@ -239,6 +467,50 @@ class JobInterpreter:
         print(f"ATS Keywords ({len(job.keywords_ats)}): {', '.join(job.keywords_ats[:10])}")
 
 
+# Instância compartilhada: o interpreter é stateless (fora o flag debug),
+# então lotes de scraping não precisam alocar um objeto por vaga
+_DEFAULT_INTERPRETER = JobInterpreter()
+
+
+@lru_cache(maxsize=1024)
+def _interpret_text(text: str) -> tuple:
+    """
+    Pipeline completo de extração memoizado por texto.
+
+    Boards re-surfaçam a mesma vaga em páginas diferentes; interpret é
+    determinístico no texto, então duplicatas pegam o resultado pronto.
+    Retorna tuplas imutáveis (seguras para compartilhar entre Jobs).
+    """
+    hard, soft, jt_counts = _scan_keywords(text)
+    tokens = set(_WORD_RE.findall(text))
+    ats = _DEFAULT_INTERPRETER._extract_ats_keywords(text, hard_skills=hard)
+    return (
+        tuple(hard),
+        tuple(soft),
+        tuple(ats),
+        _DEFAULT_INTERPRETER._detect_seniority(text),
+        _DEFAULT_INTERPRETER._job_type_from_counts(jt_counts),
+        _language_from_tokens(tokens),
+    )
+
+
+def _language_from_tokens(tokens: set) -> Language:
+    """Compara presença de palavras exclusivas de cada idioma via frozensets"""
+    return Language.EN if len(tokens & _EN_WORDS) > len(tokens & _PT_WORDS) else Language.PT
+
+
+@lru_cache(maxsize=1024)
+def _detect_language_cached(text: str) -> Language:
+    """
+    Detecção de idioma memoizada: re-submissões da mesma vaga durante a
+    iteração na UI pegam o resultado do cache em vez de recontar palavras.
+
+    Uma tokenização O(N) + lookups O(1) substitui um scan de substring
+    por palavra-sonda (8 passadas completas do texto).
+    """
+    return _language_from_tokens(set(_WORD_RE.findall(text)))
+
+
 def validate_job_scraping(title: str, company: str, description: str, url: str) -> JobValidation:
     """
     Valida se o scraping foi bem sucedido.
@@ -251,28 +523,29 @@ def validate_job_scraping(title: str, company: str, description: str, url: str)
     [ ] Idioma identificado
     """
     validation = JobValidation()
-    
+
+    # .lower() aloca uma cópia do tamanho da descrição — uma vez só
+    desc_lower = description.lower() if description else ""
+
     # Cargo
     validation.cargo_found = bool(title and len(title) > 3)
-    
+
     # Empresa
     validation.empresa_found = bool(company and len(company) > 2)
-    
+
     # Descrição
     validation.description_readable = bool(description and len(description) > 100)
     validation.raw_length = len(description) if description else 0
-    
+
     # Requisitos
-    requirements_keywords = ["requisitos", "requirements", "qualificações", "qualifications", 
-                           "experiência", "experience", "skills", "habilidades"]
-    validation.requirements_found = any(kw in description.lower() for kw in requirements_keywords) if description else False
-    
-    # Idioma
+    validation.requirements_found = bool(_REQUIREMENTS_RX.search(desc_lower)) if description else False
+
+    # Idioma (presença de cada sonda, não nº de ocorrências)
     if description:
-        pt_count = sum(1 for w in ["você", "nosso", "será", "equipe"] if w in description.lower())
-        en_count = sum(1 for w in ["you", "our", "will", "team"] if w in description.lower())
+        pt_count = len({m.lastgroup for m in _PT_LANG_RX.finditer(desc_lower)})
+        en_count = len({m.lastgroup for m in _EN_LANG_RX.finditer(desc_lower)})
         validation.language_detected = "en" if en_count > pt_count else "pt"
-    
+
     return validation
 
 
@@ -290,13 +563,17 @@ def create_job_from_scrape(
     
     Se validação falhar, Job.is_valid será False.
     """
-    import hashlib
-    
     # Validar
     validation = validate_job_scraping(title, company, description, url)
-    
-    # Criar ID único
-    job_id = hashlib.md5(f"{title}{company}{url}".encode()).hexdigest()[:12]
+
+    # Criar ID único. MD5 fica: os ids são persistidos em jobs/, trocar o
+    # hash quebraria a dedupe de vagas já salvas. update() sequencial
+    # evita a concatenação intermediária (f-string + encode do total).
+    hasher = hashlib.md5(usedforsecurity=False)
+    hasher.update(title.encode())
+    hasher.update(company.encode())
+    hasher.update(url.encode())
+    job_id = hasher.hexdigest()[:12]
     
     # Criar Job
     job = Job(
@@ -312,7 +589,6 @@ def create_job_from_scrape(
     
     # Interpretar se válido
     if validation.is_valid:
-        interpreter = JobInterpreter()
-        interpreter.interpret(job)
+        _DEFAULT_INTERPRETER.interpret(job)
     
     return job, validation
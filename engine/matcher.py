@@ -29,6 +29,21 @@ from core.config import MASTER_CV_PT, MASTER_CV_EN, MASTER_CV_JUNIOR, config
 
 # ============== MASTER CV LOADER ==============
 
+# Cache do JSON parseado por (idioma, junior_mode), invalidado por mtime.
+# Cada load() devolve um wrapper NOVO sobre o dict compartilhado, então
+# overrides tipo force_match (master.experiencias = ...) não vazam entre requests.
+_MASTER_DATA_CACHE = {}
+
+# Tokens relevantes de bullets. Os \b são necessários: \b é boundary
+# Unicode, então palavras acentuadas ("liderança") não geram token algum
+# — sem as âncoras sairiam fragmentos ("lideran", "a") como keywords.
+_BULLET_TOKEN_RE = re.compile(r'\b[a-zA-Z]{3,}\b')
+
+# Parsing de período ("2021 - Presente") no build_resume
+_YEAR_RE = re.compile(r'\d{4}')
+_PRESENT_RE = re.compile(r'Presente|Atual|Current')
+
+
 class MasterCV:
     """
     Wrapper para o Master CV JSON.
@@ -48,6 +63,28 @@ class MasterCV:
         self.formacao = self.data.get("formacao", self.data.get("education", []))
         self.skills = self.data.get("skills", {})
         self.projetos_ai = self.data.get("projetos_ai", self.data.get("ai_projects", []))
+
+        # Keywords por experiência tokenizadas UMA vez no load — cada match()
+        # re-rodava a tokenização de todos os bullets de todas as experiências.
+        # Chave por id() do dict: overrides (force_match) recebem cache miss
+        # e são computados on-demand sem servir dados velhos.
+        self._exp_kw_cache: Dict[int, Tuple[Dict, List[str], frozenset, str]] = {}
+        for exp in self.experiencias:
+            self._exp_kw_entry(exp)
+        self._all_keywords: Optional[List[str]] = None
+
+        # Skills achatadas + lowercase calculadas uma vez no load —
+        # _select_skills re-fazia o flatten e o .lower() a cada match()
+        self._flat_skills: List[str] = []
+        for category, skills in self.skills.items():
+            if category.startswith("_") or not isinstance(skills, list):
+                continue
+            for skill in skills:
+                if isinstance(skill, str):
+                    self._flat_skills.append(skill)
+                elif isinstance(skill, dict) and "name" in skill:
+                    self._flat_skills.append(skill["name"])
+        self._flat_skills_lower = [s.lower() for s in self._flat_skills]
     
     @classmethod
     def load(cls, language: Language = Language.PT, junior_mode: bool = False) -> "MasterCV":
@@ -59,14 +96,24 @@ class MasterCV:
         
         if not path.exists():
             raise FileNotFoundError(f"Master CV não encontrado: {path}")
-        
+
+        key = (language, junior_mode)
+        mtime = path.stat().st_mtime_ns
+        cached = _MASTER_DATA_CACHE.get(key)
+        if cached and cached[0] == mtime:
+            return cls(cached[1])
+
         with open(path, "r", encoding="utf-8") as f:
             data = json.load(f)
-        
+
+        _MASTER_DATA_CACHE[key] = (mtime, data)
         return cls(data)
     
     def get_all_keywords(self) -> List[str]:
-        """Retorna todas as keywords do CV para matching"""
+        """Retorna todas as keywords do CV para matching (memoizado)"""
+        if self._all_keywords is not None:
+            return self._all_keywords
+
         keywords = []
         
         # Skills
@@ -84,30 +131,93 @@ class MasterCV:
                 keywords.extend([k.lower() for k in exp["keywords"]])
             if "stack_tecnica" in exp:
                 keywords.extend([s.lower() for s in exp.get("stack_tecnica", [])])
-        
-        return list(set(keywords))
-    
+
+        # dict.fromkeys dedupa preservando a ordem de inserção —
+        # list(set(...)) embaralhava a cada processo (hash randomization)
+        self._all_keywords = list(dict.fromkeys(keywords))
+        return self._all_keywords
+
     def get_experience_keywords(self, exp: Dict) -> List[str]:
-        """Retorna keywords de uma experiência específica"""
+        """Retorna keywords de uma experiência específica (cache por load)"""
+        return self._exp_kw_entry(exp)[1]
+
+    def _exp_kw_entry(self, exp: Dict) -> Tuple[Dict, List[str], frozenset, str]:
+        """Entrada (exp, lista, frozenset, blob) de keywords da experiência.
+
+        O blob é as keywords unidas por NUL: como nenhuma keyword contém
+        NUL, `k in blob` equivale a `any(k in ek for ek in keywords)` em
+        uma única busca C-level em vez de um loop Python por keyword.
+
+        O dict da experiência fica guardado na entrada: além de validar o
+        hit por identidade, a referência impede que um dict coletado pelo
+        GC libere seu id() para outro dict herdar keywords velhas.
+        """
+        entry = self._exp_kw_cache.get(id(exp))
+        if entry is None or entry[0] is not exp:
+            keywords = self._compute_experience_keywords(exp)
+            entry = (exp, keywords, frozenset(keywords), "\x00".join(keywords))
+            self._exp_kw_cache[id(exp)] = entry
+        return entry
+
+    @staticmethod
+    def _compute_experience_keywords(exp: Dict) -> List[str]:
+        """Tokenização crua de uma experiência (roda uma vez por load)"""
         keywords = []
-        
+
         # Keywords explícitas
         if "keywords" in exp:
             keywords.extend([k.lower() for k in exp["keywords"]])
-        
+
         # Stack técnica
         if "stack_tecnica" in exp:
             keywords.extend([s.lower() for s in exp["stack_tecnica"]])
-        
+
         # Bullets text
         bullets = exp.get("bullets", exp.get("bullets_execution_first", []))
         for bullet in bullets:
             if isinstance(bullet, str):
                 # Extrair termos relevantes do bullet
-                words = re.findall(r'\b[a-zA-Z]{3,}\b', bullet.lower())
-                keywords.extend(words)
-        
-        return list(set(keywords))
+                keywords.extend(_BULLET_TOKEN_RE.findall(bullet.lower()))
+
+        # Ordem determinística: keywords explícitas > stack > bullets
+        return list(dict.fromkeys(keywords))
+
+
+def _match_keywords(
+    job_keywords: List[str],
+    exp_keywords: List[str],
+    exp_kw_set: Optional[frozenset] = None,
+    exp_kw_blob: Optional[str] = None,
+) -> List[str]:
+    """
+    Kernel do scoring: retorna as keywords da vaga cobertas pela experiência.
+    Set lookup cobre o match exato; `k in blob` (keywords unidas por NUL)
+    cobre a direção k⊂ek numa única busca C-level; o loop Python só roda
+    para o caso raro ek⊂k que as palavras inteiras de k não capturam.
+    """
+    if not job_keywords:
+        return []
+    if exp_kw_set is None:
+        exp_kw_set = frozenset(exp_keywords)
+    if exp_kw_blob is None:
+        exp_kw_blob = "\x00".join(exp_keywords)
+    # Matches exatos resolvidos em bloco (intersection roda em C);
+    # os tiers substring só examinam o resíduo.
+    exact = exp_kw_set.intersection(job_keywords)
+    if len(exact) == len(job_keywords):
+        # Cobertura exata total — nenhum tier substring necessário
+        return list(job_keywords)
+    matched = []
+    for k in job_keywords:
+        if k in exact or k in exp_kw_blob:
+            matched.append(k)
+        elif " " in k and any(w in exp_kw_set for w in k.split()):
+            # Keyword composta da vaga ("marketing digital") coberta por
+            # uma keyword-palavra da experiência
+            matched.append(k)
+        elif any(ek in k for ek in exp_keywords):
+            matched.append(k)
+    return matched
 
 
 # ============== MATCHER CLASS ==============
@@ -129,6 +239,15 @@ class CVMatcher:
         self.master = master
         self.debug = debug
         self.config = config.matching
+        # Peso de tier resolvido por experiência na construção — tira a
+        # comparação de string do loop de scoring (o matcher é sempre
+        # construído depois de qualquer override de master.experiencias)
+        self._exp_weights = [
+            self.config.core_weight
+            if exp.get("tier", "contextual") == "core"
+            else self.config.contextual_weight
+            for exp in master.experiencias
+        ]
     
     def match(self, job: Job) -> MatchResult:
         """
@@ -195,27 +314,24 @@ class CVMatcher:
         Pontua cada experiência contra keywords da vaga.
         Retorna lista de (experiência, score, keywords_matched)
         """
+        # Sem keywords não há o que escanear — todo score seria zero
+        if not job_keywords:
+            return [(exp, 0.0, []) for exp in self.master.experiencias]
+
         scores = []
-        
-        for exp in self.master.experiencias:
-            exp_keywords = self.master.get_experience_keywords(exp)
-            
+
+        # Invariantes do loop resolvidos uma vez (não por experiência)
+        inv_total = 1.0 / len(job_keywords)
+
+        for exp, weight in zip(self.master.experiencias, self._exp_weights):
+            _, exp_keywords, exp_kw_set, exp_kw_blob = self.master._exp_kw_entry(exp)
+
             # Calcular overlap
-            matched = [k for k in job_keywords if any(k in ek or ek in k for ek in exp_keywords)]
-            
-            # Score base = overlap / total keywords
-            if job_keywords:
-                base_score = len(matched) / len(job_keywords)
-            else:
-                base_score = 0
-            
-            # Multiplicador por tier
-            tier = exp.get("tier", "contextual")
-            if tier == "core":
-                score = base_score * self.config.core_weight
-            else:
-                score = base_score * self.config.contextual_weight
-            
+            matched = _match_keywords(job_keywords, exp_keywords, exp_kw_set, exp_kw_blob)
+
+            # Score = overlap / total keywords, com multiplicador por tier
+            score = len(matched) * inv_total * weight
+
             scores.append((exp, score, matched))
             
             if self.debug:
@@ -245,19 +361,23 @@ class CVMatcher:
         selected_raw.extend(core_exps[:3])
         
         # Preencher o resto com os melhores matches (CORE ou Contextual)
+        # Membership por id() do dict: comparar tuplas (dict, float, list)
+        # com == era um scan quadrático
         remaining_slots = self.config.max_experiences - len(selected_raw)
-        others = [e for e in (core_exps[3:] + contextual_exps) if e not in selected_raw]
+        selected_ids = {id(e[0]) for e in selected_raw}
+        others = [e for e in core_exps[3:] + contextual_exps if id(e[0]) not in selected_ids]
         others = sorted(others, key=lambda x: x[1], reverse=True)
         
         selected_raw.extend(others[:remaining_slots])
         
         # 4. Converter para ExperienceMatch
+        mandatory_ids = {c[0]['id'] for c in core_exps[:3]}
         selected = []
         for exp, score, matched in selected_raw:
             # Match Threshold Logic (Relaxed)
-            # Only filter if we have plenty of good candidates. 
+            # Only filter if we have plenty of good candidates.
             # If we are short on experiences, we take what we have.
-            is_mandatory_core = any(exp['id'] == c[0]['id'] for c in core_exps[:3])
+            is_mandatory_core = exp['id'] in mandatory_ids
             
             # If it's mandatory core, always keep.
             # If it's not matches threshold, keep.
@@ -292,21 +412,27 @@ class CVMatcher:
         job_keywords: List[str], 
         selected_exps: List[ExperienceMatch]
     ) -> Tuple[float, List[str], List[str]]:
-        """Calcula cobertura total de keywords"""
+        """Calcula cobertura total de keywords (set ops, sem loops aninhados)"""
         # Keywords cobertas pelas experiências selecionadas
         covered = set()
         for exp in selected_exps:
             covered.update(exp.matched_keywords)
-        
-        # Keywords faltantes
-        missing = [k for k in job_keywords if k not in covered]
-        
+
+        # Cobertura total (vagas high-match): sem diff nem scan de faltantes
+        job_set = set(job_keywords)
+        if job_keywords and covered >= job_set:
+            return 1.0, list(covered), []
+
+        # Keywords faltantes (diferença de sets, preservando ordem da vaga)
+        missing_set = job_set - covered
+        missing = [k for k in job_keywords if k in missing_set]
+
         # Score = covered / total
         if job_keywords:
             score = len(covered) / len(job_keywords)
         else:
             score = 0
-        
+
         return score, list(covered), missing
     
     def _get_tier(self, score: float) -> MatchTier:
@@ -374,26 +500,15 @@ class CVMatcher:
     
     def _select_skills(self, job_keywords: List[str]) -> List[str]:
         """Seleciona skills mais relevantes"""
-        all_skills = []
-        
-        # Flatten skills
-        for category, skills in self.master.skills.items():
-            if category.startswith("_"):
-                continue
-            if isinstance(skills, list):
-                for skill in skills:
-                    if isinstance(skill, str):
-                        all_skills.append(skill)
-                    elif isinstance(skill, dict) and "name" in skill:
-                        all_skills.append(skill["name"])
-        
-        # Priorizar skills que matcham keywords
+        # Priorizar skills que matcham keywords (lista achatada/lowercase
+        # pré-computada no load do Master CV)
+        # Fast path: set de keywords cobre o match exato antes do scan substring
+        job_kw_set = set(job_keywords)
         prioritized = []
         others = []
-        
-        for skill in all_skills:
-            skill_lower = skill.lower()
-            if any(k in skill_lower or skill_lower in k for k in job_keywords):
+
+        for skill, skill_lower in zip(self.master._flat_skills, self.master._flat_skills_lower):
+            if skill_lower in job_kw_set or any(k in skill_lower or skill_lower in k for k in job_keywords):
                 prioritized.append(skill)
             else:
                 others.append(skill)
@@ -447,10 +562,9 @@ def build_resume(master: MasterCV, match: MatchResult, job: Job) -> ResumeOutput
     def extract_end_year(period_str):
         if not period_str:
             return 0
-        if "Presente" in period_str or "Atual" in period_str or "Current" in period_str:
+        if _PRESENT_RE.search(period_str):
             return 2026 # Always top
-        import re
-        years = re.findall(r'\d{4}', period_str)
+        years = _YEAR_RE.findall(period_str)
         return int(years[-1]) if years else 0
 
     # 1. First, map selected matches to experiences
@@ -461,15 +575,18 @@ def build_resume(master: MasterCV, match: MatchResult, job: Job) -> ResumeOutput
     # from the match result if available (which might have been tailored).
     # If not in match result, we take the original.
     
-    # Create a lookup for matched experiences
-    match_lookup = {exp.company: exp for exp in match.selected_experiences}
-    
+    # Create a lookup for matched experiences.
+    # Keyed on experience_id: company name collides when the candidate
+    # held two roles at the same employer (id is unique per experience).
+    match_lookup = {exp.experience_id: exp for exp in match.selected_experiences}
+
     for orig_exp in master.experiencias:
         company = orig_exp.get("empresa", orig_exp.get("company", ""))
-        
+
         # Determine bullets: use matched version if exists (tailored/selected), else original
-        if company in match_lookup:
-            bullets = match_lookup[company].selected_bullets
+        matched_exp = match_lookup.get(orig_exp.get("id", 0))
+        if matched_exp is not None:
+            bullets = matched_exp.selected_bullets
         else:
             bullets = orig_exp.get("bullets_execution_first", orig_exp.get("bullets", []))
             
@@ -225,15 +225,15 @@ def calculate_match_score(job_keywords: List[str], profile_skills: Set[str]) ->
     
     # Direct matches
     direct_matches = job_set & profile_lower
-    
+
     # Partial matches (substring matching for compound terms)
+    # Only keywords without a direct hit enter the pairwise scan
     partial_matches = set()
-    for job_kw in job_set:
+    for job_kw in job_set - direct_matches:
         for profile_skill in profile_lower:
             if job_kw in profile_skill or profile_skill in job_kw:
-                if job_kw not in direct_matches:
-                    partial_matches.add(job_kw)
-                    break
+                partial_matches.add(job_kw)
+                break
     
     # Weighted score: direct matches worth 1.0, partial worth 0.5
     match_count = len(direct_matches) + (len(partial_matches) * 0.5)
@@ -148,6 +148,83 @@ Retorne APENAS a lista de bullets em formato JSON: ["bullet 1", "bullet 2", ...]
         # Fallback to original bullets
         return experience.get("bullets_execution_first", experience.get("bullets", []))[:3]
 
+    def _extract_json_nested(self, text: str) -> Optional[List]:
+        """
+        Extract the outermost JSON array (array-of-arrays) from LLM response.
+        _extract_json is non-greedy and would stop at the first inner array.
+        """
+        if not text:
+            return None
+
+        try:
+            if "```json" in text:
+                text = text.split("```json")[1].split("```")[0]
+            elif "```" in text:
+                text = text.split("```")[1].split("```")[0]
+
+            import re
+            match = re.search(r'\[.*\]', text, re.DOTALL)
+            if match:
+                return json.loads(match.group())
+
+            return json.loads(text.strip())
+        except (json.JSONDecodeError, Exception) as e:
+            logger.warning(f"Failed to parse batch JSON: {e}")
+            return None
+
+    def tailor_batch(self, job: Job, experiences: List[Dict]) -> List[List[str]]:
+        """
+        Tailors N experiences in a SINGLE LLM call (one round-trip instead of N).
+        Returns one bullet list per experience, in the same order.
+        """
+        fallback = [
+            exp.get("bullets_execution_first", exp.get("bullets", []))[:3]
+            for exp in experiences
+        ]
+
+        if not self.available or not experiences:
+            return fallback
+
+        blocks = []
+        for i, exp in enumerate(experiences):
+            bullets = "\n".join(exp.get("bullets_execution_first", exp.get("bullets", [])))
+            blocks.append(
+                f"EXPERIÊNCIA {i + 1}:\n"
+                f"Empresa: {exp.get('empresa', exp.get('company', 'N/A'))}\n"
+                f"Cargo: {exp.get('cargo', exp.get('role', 'N/A'))}\n"
+                f"Bullets:\n{bullets}"
+            )
+
+        prompt = f"""Você é um Career Agent Sênior especializado em GTM e Performance.
+REESCREVA os bullets de CADA experiência abaixo para maximizar o match com a vaga, sem inventar dados.
+
+VAGA: {job.title} em {job.company}
+SKILLS DESEJADAS: {', '.join(job.hard_skills + job.keywords_ats) if (job.hard_skills or job.keywords_ats) else 'Gerais'}
+
+{chr(10).join(blocks)}
+
+REGRAS DE OURO:
+1. Mantenha os números e resultados intactos
+2. Bridge the Gap: use a terminologia da vaga quando for tecnicamente correto
+3. 3-4 bullets curtos e impactantes por experiência
+4. Idioma: {job.language.value.upper()}
+
+Retorne APENAS um JSON array com UM array de bullets por experiência, na mesma ordem:
+[["bullet 1", "bullet 2"], ["bullet 1", ...], ...]"""
+
+        result = self._generate(prompt, use_case="tailoring", max_tokens=3000)
+        parsed = self._extract_json_nested(result)
+
+        if (
+            isinstance(parsed, list)
+            and len(parsed) == len(experiences)
+            and all(isinstance(b, list) for b in parsed)
+        ):
+            return parsed
+
+        logger.warning("Batch tailoring parse failed, falling back to original bullets")
+        return fallback
+
     def tailor_experience_enriched(self, job: Job, experience: Dict, rules: Dict) -> List[str]:
         """
         Enhanced version of tailor_experience that respects anti-overqualification rules.
@@ -226,28 +303,27 @@ Retorne APENAS JSON: ["bullet 1", ...]"""
         if not self.available:
             return master_cv.get("experiencias", [])
 
-        tailored_exps = []
-        
-        # Sort experiences first to ensure context (optional, but good for processing)
-        # We process all of them
         all_exps = master_cv.get("experiencias", [])
-        
-        for exp in all_exps:
-            # Deep copy to avoid mutating original structure too much if not needed
-            new_exp = exp.copy()
-            
-            # Use specific prompt for Skill Transposition
-            prompt = f"""Você é um Expert em Recrutamento e Engenharia de Currículos.
-Sua missão: Realizar 'Skill Transposition' para alinhar a experiência do candidato à vaga.
+
+        # One batched Skill Transposition call for ALL experiences
+        # (1 round-trip instead of N sequential LLM calls)
+        blocks = []
+        for i, exp in enumerate(all_exps):
+            bullets = "\n".join(exp.get('bullets_execution_first', exp.get('bullets', [])))
+            blocks.append(
+                f"EXPERIÊNCIA {i + 1}:\n"
+                f"Empresa: {exp.get('empresa', exp.get('company'))}\n"
+                f"Cargo: {exp.get('cargo', exp.get('role'))}\n"
+                f"Bullets Atuais:\n{bullets}"
+            )
+
+        prompt = f"""Você é um Expert em Recrutamento e Engenharia de Currículos.
+Sua missão: Realizar 'Skill Transposition' para alinhar CADA experiência do candidato à vaga.
 
 VAGA ALVO: {job.title} em {job.company}
 KEYWORDS DA VAGA: {', '.join(job.hard_skills + job.keywords_ats)}
 
-EXPERIÊNCIA ORIGINAL:
-Empresa: {exp.get('empresa', exp.get('company'))}
-Cargo: {exp.get('cargo', exp.get('role'))}
-Bullets Atuais:
-{chr(10).join(exp.get('bullets_execution_first', exp.get('bullets', [])))}
+{chr(10).join(blocks)}
 
 DIRETRIZES:
 1. Analise os bullets originais e veja se alguma realização prova competência nas Keywords da Vaga.
@@ -257,17 +333,27 @@ DIRETRIZES:
 5. Mantenha números e métricas.
 6. Idioma: {job.language.value.upper()}
 
-Retorne APENAS a lista de bullets (JSON array of strings)."""
+Retorne APENAS um JSON array com UM array de bullets por experiência, na mesma ordem:
+[["bullet 1", ...], ["bullet 1", ...], ...]"""
 
-            result = self._generate(prompt, use_case="tailoring")
-            new_bullets = self._extract_json(result)
-            
-            if new_bullets:
-                new_exp["bullets"] = new_bullets
-                new_exp["bullets_execution_first"] = new_bullets # Updates priority bullets
-            
+        result = self._generate(prompt, use_case="tailoring", max_tokens=4000)
+        parsed = self._extract_json_nested(result)
+
+        batch_ok = (
+            isinstance(parsed, list)
+            and len(parsed) == len(all_exps)
+            and all(isinstance(b, list) for b in parsed)
+        )
+
+        tailored_exps = []
+        for i, exp in enumerate(all_exps):
+            # Deep copy to avoid mutating original structure too much if not needed
+            new_exp = exp.copy()
+            if batch_ok and parsed[i]:
+                new_exp["bullets"] = parsed[i]
+                new_exp["bullets_execution_first"] = parsed[i]  # Updates priority bullets
             tailored_exps.append(new_exp)
-            
+
         return tailored_exps
 
     def generate_headline(self, job: Job, candidate_skills: List[str]) -> str:
@@ -28,7 +28,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 from core import (
     Job, Language, Seniority, OutputFormat,
     MatchResult, ResumeOutput, PipelineState,
-    OUTPUT_DIR, JOBS_DIR, config
+    OUTPUT_DIR, JOBS_DIR, config, ensure_dirs
 )
 from engine import (
     JobInterpreter, CVMatcher, MasterCV,
@@ -506,11 +506,14 @@ Exemplos:
     parser.add_argument("--debug", "-d", action="store_true", help="Modo debug")
     
     args = parser.parse_args()
-    
+
     # Validar input
     if not args.job and not args.text:
         parser.error("Informe uma URL, arquivo ou use --text para texto direto")
-    
+
+    # Diretórios de saída (o mkdir saiu do import de core.config)
+    ensure_dirs()
+
     # Executar
     result = run_pipeline(
         job_input=args.job,
@@ -161,6 +161,144 @@ def test_keyword_extraction_regex():
     return True
 
 
+def test_job_interpreter_extraction():
+    """Test: scanner extraction matches baseline on PT and EN samples"""
+    from engine.interpreter import JobInterpreter
+    from core.models import Job, Language, Seniority
+
+    interpreter = JobInterpreter()
+
+    pt_job = Job(
+        id="test-pt",
+        title="Analista de BI Sênior",
+        company="TestCorp",
+        description=(
+            "Procuramos analista para liderar equipe. Experiência com power bi, "
+            "sql e dashboards. Acompanhar kpi/roi e cac em relatórios kpi-driven. "
+            "Você vai atuar com stakeholders e nossos projetos serão ágeis. E aí, bora?"
+        ),
+        url="https://example.com/pt",
+        location="Remoto",
+    )
+    interpreter.interpret(pt_job)
+
+    # "power bi" deve render "bi" mesmo co-ocorrendo com padrões mais longos
+    assert "bi" in pt_job.hard_skills, f"'bi' not extracted: {pt_job.hard_skills}"
+    assert "sql" in pt_job.hard_skills, f"'sql' not extracted: {pt_job.hard_skills}"
+    assert "dashboard" in pt_job.hard_skills, f"'dashboard' not extracted: {pt_job.hard_skills}"
+    # "E aí" vira "e ai" após o fold de acentos mas NÃO é a skill "ai"
+    assert "ai" not in pt_job.hard_skills, f"accent fold leaked 'ai': {pt_job.hard_skills}"
+    # Acrônimos dentro de tokens colados ("kpi/roi", "kpi-driven")
+    for acronym in ("kpi", "roi", "cac"):
+        assert acronym in pt_job.keywords_ats, f"'{acronym}' missing from ATS: {pt_job.keywords_ats}"
+    assert pt_job.seniority == Seniority.SENIOR, f"Expected SENIOR, got {pt_job.seniority}"
+    assert pt_job.language == Language.PT, f"Expected PT, got {pt_job.language}"
+
+    en_job = Job(
+        id="test-en",
+        title="Senior Product Manager",
+        company="TestCorp",
+        description=(
+            "You will lead our team, drive machine learning and AI initiatives, "
+            "own KPI and ROI tracking, improve NPS, and partner with data engineering."
+        ),
+        url="https://example.com/en",
+        location="Remote",
+    )
+    interpreter.interpret(en_job)
+
+    assert "ai" in en_job.hard_skills, f"'ai' not extracted: {en_job.hard_skills}"
+    assert "ml" in en_job.hard_skills, f"'ml' not extracted: {en_job.hard_skills}"
+    for acronym in ("kpi", "roi", "nps"):
+        assert acronym in en_job.keywords_ats, f"'{acronym}' missing from ATS: {en_job.keywords_ats}"
+    assert en_job.language == Language.EN, f"Expected EN, got {en_job.language}"
+
+    logger.info("✅ Interpreter extraction matches baseline on PT and EN samples")
+    return True
+
+
+def test_interpret_many_batch_parity():
+    """Test: interpret_many produces the same fields as per-job interpret"""
+    from engine.interpreter import JobInterpreter
+    from core.models import Job
+
+    descriptions = [
+        ("Analista de Dados", "Experiência com python, sql e power bi. Você vai liderar nosso time."),
+        ("Product Manager", "Own the roadmap, drive OKRs, track KPI and ROI with our team."),
+        ("Coordenador de Marketing", "Gestão de campanhas, seo, crm e relatórios de cac/ltv."),
+    ]
+
+    def make_jobs(prefix):
+        return [
+            Job(
+                id=f"{prefix}-{i}",
+                title=title,
+                company="TestCorp",
+                description=desc,
+                url=f"https://example.com/{prefix}-{i}",
+                location="Remoto",
+            )
+            for i, (title, desc) in enumerate(descriptions)
+        ]
+
+    interpreter = JobInterpreter()
+    batch = interpreter.interpret_many(make_jobs("batch"))
+    singles = [interpreter.interpret(job) for job in make_jobs("single")]
+
+    for b, s in zip(batch, singles):
+        assert b.hard_skills == s.hard_skills, f"hard_skills diverge: {b.hard_skills} != {s.hard_skills}"
+        assert b.soft_skills == s.soft_skills, f"soft_skills diverge: {b.soft_skills} != {s.soft_skills}"
+        assert b.keywords_ats == s.keywords_ats, f"ATS diverge: {b.keywords_ats} != {s.keywords_ats}"
+        assert b.seniority == s.seniority, f"seniority diverge: {b.seniority} != {s.seniority}"
+        assert b.job_type == s.job_type, f"job_type diverge: {b.job_type} != {s.job_type}"
+        assert b.language == s.language, f"language diverge: {b.language} != {s.language}"
+
+    logger.info(f"✅ interpret_many matches interpret on {len(batch)} jobs")
+    return True
+
+
+def test_bullet_tokenizer_boundaries():
+    """Test: bullet tokenizer keeps word boundaries on accented text"""
+    from engine.matcher import _BULLET_TOKEN_RE
+
+    # \b é boundary Unicode: palavras acentuadas não podem virar fragmentos
+    # ASCII ("liderança" -> "lideran" seria um token fantasma)
+    tokens = _BULLET_TOKEN_RE.findall("liderança de equipe remota e gestão ágil")
+    assert tokens == ["equipe", "remota"], f"Unexpected tokens: {tokens}"
+    assert "lideran" not in tokens, "Fragment of accented word leaked into tokens"
+
+    tokens = _BULLET_TOKEN_RE.findall("Increased revenue by 25% via A/B testing")
+    assert tokens == ["Increased", "revenue", "via", "testing"], f"Unexpected tokens: {tokens}"
+
+    logger.info("✅ Bullet tokenizer respects word boundaries")
+    return True
+
+
+def test_llm_response_cache():
+    """Test: LLM response cache honors TTL and maxsize"""
+    from core.llm_service import _ResponseCache
+
+    # Hit básico
+    cache = _ResponseCache(maxsize=2, ttl_seconds=3600)
+    cache.put("k1", "v1")
+    assert cache.get("k1") == "v1", "Cache miss on fresh entry"
+    assert cache.get("unknown") is None, "Unknown key should miss"
+
+    # Eviction LRU: com maxsize=2, inserir um terceiro expulsa o mais antigo
+    cache.put("k2", "v2")
+    cache.put("k3", "v3")
+    assert cache.get("k1") is None, "Oldest entry should be evicted"
+    assert cache.get("k2") == "v2" and cache.get("k3") == "v3", "Recent entries lost"
+
+    # TTL: entrada expirada não é servida
+    expired = _ResponseCache(maxsize=2, ttl_seconds=0)
+    expired.put("k1", "v1")
+    assert expired.get("k1") is None, "Expired entry should not be served"
+
+    logger.info(f"✅ Response cache OK (hits={cache.hits}, misses={cache.misses})")
+    return True
+
+
 def test_match_score_calculation():
     """Test: Match score calculation is accurate"""
     from engine.matcher_utils import calculate_match_score
@@ -471,6 +609,10 @@ def run_suite() -> SuiteResult:
         test_master_cv_structure,
         test_profile_skills_loading,
         test_keyword_extraction_regex,
+        test_job_interpreter_extraction,
+        test_interpret_many_batch_parity,
+        test_bullet_tokenizer_boundaries,
+        test_llm_response_cache,
         test_match_score_calculation,
         test_match_job_to_profile,
         test_scraper_job_dataclass,
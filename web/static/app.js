@@ -484,19 +484,32 @@ class TailorApp {
         this.goToStep(4);
     }
 
+    async pollGenerate(payload) {
+        // /api/generate now renders in a background worker; poll until done
+        const response = await fetch('/api/generate', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify(payload)
+        });
+        const task = await response.json();
+        if (!task.success || !task.task_id) return task;
+
+        while (true) {
+            await new Promise(resolve => setTimeout(resolve, 1000));
+            const statusRes = await fetch(`/api/generate/status/${task.task_id}`);
+            const data = await statusRes.json();
+            if (data.status !== 'pending') return data;
+        }
+    }
+
     async fetchFullPreview() {
         try {
-            const response = await fetch('/api/generate', {
-                method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({
-                    job: this.state.job,
-                    language: this.state.language,
-                    junior_mode: this.state.mode === 'junior',
-                    format: 'html' // We want the object data ideally
-                })
+            const data = await this.pollGenerate({
+                job: this.state.job,
+                language: this.state.language,
+                junior_mode: this.state.mode === 'junior',
+                format: 'html' // We want the object data ideally
             });
-            const data = await response.json();
             if (data.success) {
                 // Parse HTML or use a new endpoint? 
                 // The current /api/generate returns a file path and a 'html_preview' string.
@@ -566,13 +579,7 @@ class TailorApp {
 
         // ... existing logic ...
         try {
-            const response = await fetch('/api/generate', {
-                method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify(payload)
-            });
-
-            const data = await response.json();
+            const data = await this.pollGenerate(payload);
             this.hideLoading();
 
             if (!data.success) {